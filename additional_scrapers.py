@@ -4,459 +4,311 @@ Additional Business Listing Scrapers
 Scrapers for BizQuest, LoopNet, DealStream, and BusinessBroker.net
 """
 
-import re
-import time
 import logging
-from typing import List, Optional
-from urllib.parse import urljoin, urlparse
+from typing import Dict, List, Optional
 
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import requests
+from lxml import etree
 
-from business_scraper import BusinessScraper, BusinessListing
+from browser_pool import get_browser_pool
+from business_scraper import BusinessScraper, BusinessListing, ProxyRotator, page_store, _has_class
 
 logger = logging.getLogger(__name__)
 
+# Selectors are compiled once at import and reused for every page and listing
+_BIZQUEST_ITEMS = etree.XPath(f"//div[{_has_class('listing-item')}]")
+_BIZQUEST_NEXT = etree.XPath(f"//a[{_has_class('pagination-next')}]/@href")
+_BIZQUEST_NAME = etree.XPath(f".//*[{_has_class('biz-title')}]//a")
+_BIZQUEST_URL = etree.XPath(f".//*[{_has_class('biz-title')}]//a/@href")
+_BIZQUEST_PRICE = etree.XPath(f".//*[{_has_class('price')}]")
+_BIZQUEST_LOCATION = etree.XPath(f".//*[{_has_class('location')}]")
+_BIZQUEST_DESCRIPTION = etree.XPath(f".//*[{_has_class('description')}]")
+_BIZQUEST_INDUSTRY = etree.XPath(f".//*[{_has_class('industry')}]")
+
+_LOOPNET_ITEMS = etree.XPath(f"//*[{_has_class('placard')}]")
+_LOOPNET_NEXT = etree.XPath("//a[@aria-label='Next']/@href")
+_LOOPNET_NAME = etree.XPath(f".//*[{_has_class('placard-title')}]//a")
+_LOOPNET_URL = etree.XPath(f".//*[{_has_class('placard-title')}]//a/@href")
+_LOOPNET_PRICE = etree.XPath(f".//*[{_has_class('placard-price')}]")
+_LOOPNET_ADDRESS = etree.XPath(f".//*[{_has_class('placard-address')}]")
+_LOOPNET_PROPERTY_TYPE = etree.XPath(f".//*[{_has_class('placard-property-type')}]")
+
+_DEALSTREAM_ITEMS = etree.XPath(f"//*[{_has_class('deal-listing')}]")
+_DEALSTREAM_NEXT = etree.XPath(f"//a[{_has_class('next-page')}]/@href")
+_DEALSTREAM_NAME = etree.XPath(f".//*[{_has_class('deal-title')}]//a")
+_DEALSTREAM_URL = etree.XPath(f".//*[{_has_class('deal-title')}]//a/@href")
+_DEALSTREAM_PRICE = etree.XPath(f".//*[{_has_class('deal-price')}]")
+_DEALSTREAM_LOCATION = etree.XPath(f".//*[{_has_class('deal-location')}]")
+_DEALSTREAM_DESCRIPTION = etree.XPath(f".//*[{_has_class('deal-description')}]")
+
+_BUSINESSBROKER_ITEMS = etree.XPath(f"//div[{_has_class('business-listing')}]")
+_BUSINESSBROKER_NEXT = etree.XPath("//a[@rel='next']/@href")
+_BUSINESSBROKER_NAME = etree.XPath(f".//a[{_has_class('business-title')}]")
+_BUSINESSBROKER_URL = etree.XPath(f".//a[{_has_class('business-title')}]/@href")
+_BUSINESSBROKER_PRICE = etree.XPath(f".//span[{_has_class('price')}]")
+_BUSINESSBROKER_LOCATION = etree.XPath(f".//span[{_has_class('location')}]")
+_BUSINESSBROKER_DESCRIPTION = etree.XPath(f".//div[{_has_class('description')}]")
+
 class BizQuestScraper(BusinessScraper):
     """Scraper for BizQuest.com"""
     
-    def __init__(self):
-        super().__init__()
+    platform = "BizQuest"
+    
+    def __init__(self, session: Optional[requests.Session] = None, proxies: Optional[ProxyRotator] = None):
+        super().__init__(session, proxies)
         self.base_url = "https://www.bizquest.com"
     
     def scrape_listings(self, max_pages: int = 5) -> List[BusinessListing]:
         """Scrape business listings from BizQuest"""
-        listings = []
-        driver = self.setup_selenium_driver()
+        # BizQuest search URL for New York area
+        search_url = f"{self.base_url}/businesses-for-sale/new-york/"
+        
+        rows = self._scrape_static_pages(
+            search_url, max_pages,
+            item_xpath=_BIZQUEST_ITEMS,
+            next_xpath=_BIZQUEST_NEXT,
+            extract=self._extract_bizquest_static
+        )
+        if rows is None:
+            logger.info("BizQuest static fetch returned no listings, falling back to Selenium")
+            rows = self._scrape_bizquest_selenium(search_url, max_pages)
+        
+        return self._qualifying_listings(rows)
+    
+    def _extract_bizquest_static(self, element) -> Optional[Dict[str, str]]:
+        """Extract raw fields from a BizQuest listing parsed with lxml"""
+        name = self._xpath_text(element, _BIZQUEST_NAME)
+        if not name:
+            return None
         
+        return {
+            'name': name,
+            'listing_url': self._xpath_text(element, _BIZQUEST_URL),
+            'price_text': self._xpath_text(element, _BIZQUEST_PRICE),
+            'address': self._xpath_text(element, _BIZQUEST_LOCATION),
+            'description': self._xpath_text(element, _BIZQUEST_DESCRIPTION),
+            'industry': self._xpath_text(element, _BIZQUEST_INDUSTRY)
+        }
+    
+    def _scrape_bizquest_selenium(self, search_url: str, max_pages: int) -> List[Dict[str, str]]:
+        """Scrape BizQuest with a pooled browser when the static fetch fails"""
+        rows = []
         try:
-            # BizQuest search URL for New York area
-            search_url = f"{self.base_url}/businesses-for-sale/new-york/"
-            driver.get(search_url)
-            
-            # Wait for listings to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "listing-item"))
-            )
-            
-            for page in range(max_pages):
-                logger.info(f"Scraping BizQuest page {page + 1}")
-                
-                # Find all listing elements
-                listing_elements = driver.find_elements(By.CLASS_NAME, "listing-item")
+            with get_browser_pool().acquire() as driver:
+                driver.get(search_url)
                 
-                for element in listing_elements:
-                    try:
-                        listing = self._extract_bizquest_listing(element, driver)
-                        if listing and self._meets_criteria(listing):
-                            listings.append(listing)
-                    except Exception as e:
-                        logger.warning(f"Failed to extract BizQuest listing: {e}")
-                        continue
-                
-                # Navigate to next page
-                try:
-                    next_button = driver.find_element(By.CSS_SELECTOR, "a.pagination-next")
-                    if next_button.is_enabled():
-                        driver.execute_script("arguments[0].click();", next_button)
-                        time.sleep(3)
-                    else:
+                for page in range(max_pages):
+                    logger.info(f"Scraping BizQuest page {page + 1}")
+                    
+                    # Wait for listings to load, then abort any remaining requests
+                    self.wait_for_listings(driver, "listing-item", timeout=10)
+                    
+                    # Extract all listings on the page in one round-trip
+                    rows.extend(self.extract_listings_js(driver, ".listing-item", ".biz-title a", {
+                        'price_text': ".price",
+                        'address': ".location",
+                        'description': ".description",
+                        'industry': ".industry"
+                    }))
+                    
+                    # Navigate to next page once the current results are replaced
+                    if not self.click_next_page(driver, "a.pagination-next", ".listing-item"):
                         break
-                except NoSuchElementException:
-                    break
         
         except Exception as e:
             logger.error(f"Error scraping BizQuest: {e}")
         
-        finally:
-            driver.quit()
-        
-        return listings
-    
-    def _extract_bizquest_listing(self, element, driver) -> Optional[BusinessListing]:
-        """Extract data from a BizQuest listing element"""
-        try:
-            # Extract basic information
-            name_elem = element.find_element(By.CSS_SELECTOR, ".biz-title a")
-            name = name_elem.text.strip()
-            listing_url = name_elem.get_attribute("href")
-            
-            # Extract price
-            try:
-                price_elem = element.find_element(By.CSS_SELECTOR, ".price")
-                price_text = price_elem.text.strip()
-                price = self.extract_price(price_text)
-            except NoSuchElementException:
-                price = 0
-            
-            # Extract location
-            try:
-                location_elem = element.find_element(By.CSS_SELECTOR, ".location")
-                address = location_elem.text.strip()
-            except NoSuchElementException:
-                address = "Location not specified"
-            
-            # Get additional details (simplified for demo)
-            description = self._get_text_safe(element, ".description")
-            industry = self._get_text_safe(element, ".industry")
-            
-            # Assess business characteristics
-            ai_disruptability = self.assess_ai_disruptability(description, industry)
-            labor_intensity = self.assess_labor_intensity(description, "")
-            visit_frequency = self.determine_visit_frequency(description, industry)
-            
-            # Calculate distance
-            distance = self.location_service.calculate_distance(address)
-            
-            return BusinessListing(
-                name=name,
-                address=address,
-                price=price,
-                earnings_multiple=0.0,  # Would need detailed page scraping
-                ownership_structure="unknown",
-                visit_frequency=visit_frequency,
-                reason_for_sale="not specified",
-                ai_disruptability=ai_disruptability,
-                labor_intensity=labor_intensity,
-                platform="BizQuest",
-                listing_url=listing_url,
-                distance_miles=distance
-            )
-            
-        except Exception as e:
-            logger.warning(f"Failed to extract BizQuest listing data: {e}")
-            return None
-    
-    def _get_text_safe(self, element, selector: str) -> str:
-        """Safely extract text from an element"""
-        try:
-            sub_element = element.find_element(By.CSS_SELECTOR, selector)
-            return sub_element.text.strip()
-        except NoSuchElementException:
-            return ""
+        return rows
 
 class LoopNetScraper(BusinessScraper):
     """Scraper for LoopNet business sales section"""
     
-    def __init__(self):
-        super().__init__()
+    platform = "LoopNet"
+    
+    def __init__(self, session: Optional[requests.Session] = None, proxies: Optional[ProxyRotator] = None):
+        super().__init__(session, proxies)
         self.base_url = "https://www.loopnet.com"
     
     def scrape_listings(self, max_pages: int = 3) -> List[BusinessListing]:
         """Scrape business listings from LoopNet"""
-        listings = []
-        driver = self.setup_selenium_driver()
+        # LoopNet business for sale search in NYC area
+        search_url = f"{self.base_url}/search/businesses-for-sale/new-york-ny/"
+        
+        rows = self._scrape_static_pages(
+            search_url, max_pages,
+            item_xpath=_LOOPNET_ITEMS,
+            next_xpath=_LOOPNET_NEXT,
+            extract=self._extract_loopnet_static
+        )
+        if rows is None:
+            logger.info("LoopNet static fetch returned no listings, falling back to Selenium")
+            rows = self._scrape_loopnet_selenium(search_url, max_pages)
         
+        return self._qualifying_listings(rows)
+    
+    def _extract_loopnet_static(self, element) -> Optional[Dict[str, str]]:
+        """Extract raw fields from a LoopNet listing parsed with lxml"""
+        name = self._xpath_text(element, _LOOPNET_NAME)
+        if not name:
+            return None
+        
+        return {
+            'name': name,
+            'listing_url': self._xpath_text(element, _LOOPNET_URL),
+            'price_text': self._xpath_text(element, _LOOPNET_PRICE),
+            'address': self._xpath_text(element, _LOOPNET_ADDRESS),
+            'description': self._xpath_text(element, _LOOPNET_PROPERTY_TYPE),
+            'industry': name
+        }
+    
+    def _scrape_loopnet_selenium(self, search_url: str, max_pages: int) -> List[Dict[str, str]]:
+        """Scrape LoopNet with a pooled browser when the static fetch fails"""
+        rows = []
         try:
-            # LoopNet business for sale search in NYC area
-            search_url = f"{self.base_url}/search/businesses-for-sale/new-york-ny/"
-            driver.get(search_url)
-            
-            # Wait for listings to load
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "placard"))
-            )
-            
-            for page in range(max_pages):
-                logger.info(f"Scraping LoopNet page {page + 1}")
-                
-                # Find all listing elements
-                listing_elements = driver.find_elements(By.CLASS_NAME, "placard")
-                
-                for element in listing_elements:
-                    try:
-                        listing = self._extract_loopnet_listing(element)
-                        if listing and self._meets_criteria(listing):
-                            listings.append(listing)
-                    except Exception as e:
-                        logger.warning(f"Failed to extract LoopNet listing: {e}")
-                        continue
+            # LoopNet results are rendered client-side and need JavaScript
+            with get_browser_pool().acquire() as driver:
+                driver.get(search_url)
                 
-                # Navigate to next page
-                try:
-                    next_button = driver.find_element(By.CSS_SELECTOR, "button[aria-label='Next']")
-                    if next_button.is_enabled():
-                        driver.execute_script("arguments[0].click();", next_button)
-                        time.sleep(3)
-                    else:
+                for page in range(max_pages):
+                    logger.info(f"Scraping LoopNet page {page + 1}")
+                    
+                    # Wait for listings to load, then abort any remaining requests
+                    self.wait_for_listings(driver, "placard", timeout=15)
+                    
+                    # Extract all listings on the page in one round-trip
+                    page_rows = self.extract_listings_js(driver, ".placard", ".placard-title a", {
+                        'price_text': ".placard-price",
+                        'address': ".placard-address",
+                        'description': ".placard-property-type"
+                    })
+                    for row in page_rows:
+                        row['industry'] = row['name']
+                    rows.extend(page_rows)
+                    
+                    # Navigate to next page once the current results are replaced
+                    if not self.click_next_page(driver, "button[aria-label='Next']", ".placard"):
                         break
-                except NoSuchElementException:
-                    break
         
         except Exception as e:
             logger.error(f"Error scraping LoopNet: {e}")
         
-        finally:
-            driver.quit()
-        
-        return listings
-    
-    def _extract_loopnet_listing(self, element) -> Optional[BusinessListing]:
-        """Extract data from a LoopNet listing element"""
-        try:
-            # Extract basic information
-            name_elem = element.find_element(By.CSS_SELECTOR, ".placard-title a")
-            name = name_elem.text.strip()
-            listing_url = name_elem.get_attribute("href")
-            
-            # Extract price
-            try:
-                price_elem = element.find_element(By.CSS_SELECTOR, ".placard-price")
-                price_text = price_elem.text.strip()
-                price = self.extract_price(price_text)
-            except NoSuchElementException:
-                price = 0
-            
-            # Extract location
-            try:
-                location_elem = element.find_element(By.CSS_SELECTOR, ".placard-address")
-                address = location_elem.text.strip()
-            except NoSuchElementException:
-                address = "Location not specified"
-            
-            # Get property type/description
-            try:
-                description_elem = element.find_element(By.CSS_SELECTOR, ".placard-property-type")
-                description = description_elem.text.strip()
-            except NoSuchElementException:
-                description = ""
-            
-            # Assess business characteristics
-            ai_disruptability = self.assess_ai_disruptability(description, name)
-            labor_intensity = self.assess_labor_intensity(description, "")
-            visit_frequency = self.determine_visit_frequency(description, name)
-            
-            # Calculate distance
-            distance = self.location_service.calculate_distance(address)
-            
-            return BusinessListing(
-                name=name,
-                address=address,
-                price=price,
-                earnings_multiple=0.0,
-                ownership_structure="unknown",
-                visit_frequency=visit_frequency,
-                reason_for_sale="not specified",
-                ai_disruptability=ai_disruptability,
-                labor_intensity=labor_intensity,
-                platform="LoopNet",
-                listing_url=listing_url,
-                distance_miles=distance
-            )
-            
-        except Exception as e:
-            logger.warning(f"Failed to extract LoopNet listing data: {e}")
-            return None
+        return rows
 
 class DealStreamScraper(BusinessScraper):
     """Scraper for DealStream (formerly MergerNetwork)"""
     
-    def __init__(self):
-        super().__init__()
+    platform = "DealStream"
+    
+    def __init__(self, session: Optional[requests.Session] = None, proxies: Optional[ProxyRotator] = None):
+        super().__init__(session, proxies)
         self.base_url = "https://www.dealstream.com"
     
     def scrape_listings(self, max_pages: int = 3) -> List[BusinessListing]:
         """Scrape business listings from DealStream"""
-        listings = []
-        driver = self.setup_selenium_driver()
+        # DealStream search for businesses in New York
+        search_url = f"{self.base_url}/businesses-for-sale/New-York"
+        
+        rows = self._scrape_static_pages(
+            search_url, max_pages,
+            item_xpath=_DEALSTREAM_ITEMS,
+            next_xpath=_DEALSTREAM_NEXT,
+            extract=self._extract_dealstream_static
+        )
+        if rows is None:
+            logger.info("DealStream static fetch returned no listings, falling back to Selenium")
+            rows = self._scrape_dealstream_selenium(search_url, max_pages)
         
+        return self._qualifying_listings(rows)
+    
+    def _extract_dealstream_static(self, element) -> Optional[Dict[str, str]]:
+        """Extract raw fields from a DealStream listing parsed with lxml"""
+        name = self._xpath_text(element, _DEALSTREAM_NAME)
+        if not name:
+            return None
+        
+        return {
+            'name': name,
+            'listing_url': self._xpath_text(element, _DEALSTREAM_URL),
+            'price_text': self._xpath_text(element, _DEALSTREAM_PRICE),
+            'address': self._xpath_text(element, _DEALSTREAM_LOCATION),
+            'description': self._xpath_text(element, _DEALSTREAM_DESCRIPTION),
+            'industry': name
+        }
+    
+    def _scrape_dealstream_selenium(self, search_url: str, max_pages: int) -> List[Dict[str, str]]:
+        """Scrape DealStream with a pooled browser when the static fetch fails"""
+        rows = []
         try:
-            # DealStream search for businesses in New York
-            search_url = f"{self.base_url}/businesses-for-sale/New-York"
-            driver.get(search_url)
-            
-            # Wait for listings to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "deal-listing"))
-            )
-            
-            for page in range(max_pages):
-                logger.info(f"Scraping DealStream page {page + 1}")
+            with get_browser_pool().acquire() as driver:
+                driver.get(search_url)
                 
-                # Find all listing elements
-                listing_elements = driver.find_elements(By.CLASS_NAME, "deal-listing")
-                
-                for element in listing_elements:
-                    try:
-                        listing = self._extract_dealstream_listing(element)
-                        if listing and self._meets_criteria(listing):
-                            listings.append(listing)
-                    except Exception as e:
-                        logger.warning(f"Failed to extract DealStream listing: {e}")
-                        continue
-                
-                # Navigate to next page
-                try:
-                    next_button = driver.find_element(By.CSS_SELECTOR, ".next-page")
-                    if next_button.is_enabled():
-                        driver.execute_script("arguments[0].click();", next_button)
-                        time.sleep(3)
-                    else:
+                for page in range(max_pages):
+                    logger.info(f"Scraping DealStream page {page + 1}")
+                    
+                    # Wait for listings to load, then abort any remaining requests
+                    self.wait_for_listings(driver, "deal-listing", timeout=10)
+                    
+                    # Extract all listings on the page in one round-trip
+                    page_rows = self.extract_listings_js(driver, ".deal-listing", ".deal-title a", {
+                        'price_text': ".deal-price",
+                        'address': ".deal-location",
+                        'description': ".deal-description"
+                    })
+                    for row in page_rows:
+                        row['industry'] = row['name']
+                    rows.extend(page_rows)
+                    
+                    # Navigate to next page once the current results are replaced
+                    if not self.click_next_page(driver, ".next-page", ".deal-listing"):
                         break
-                except NoSuchElementException:
-                    break
         
         except Exception as e:
             logger.error(f"Error scraping DealStream: {e}")
         
-        finally:
-            driver.quit()
-        
-        return listings
-    
-    def _extract_dealstream_listing(self, element) -> Optional[BusinessListing]:
-        """Extract data from a DealStream listing element"""
-        try:
-            # Extract basic information
-            name_elem = element.find_element(By.CSS_SELECTOR, ".deal-title a")
-            name = name_elem.text.strip()
-            listing_url = name_elem.get_attribute("href")
-            
-            # Extract price
-            try:
-                price_elem = element.find_element(By.CSS_SELECTOR, ".deal-price")
-                price_text = price_elem.text.strip()
-                price = self.extract_price(price_text)
-            except NoSuchElementException:
-                price = 0
-            
-            # Extract location
-            try:
-                location_elem = element.find_element(By.CSS_SELECTOR, ".deal-location")
-                address = location_elem.text.strip()
-            except NoSuchElementException:
-                address = "Location not specified"
-            
-            # Get description
-            try:
-                description_elem = element.find_element(By.CSS_SELECTOR, ".deal-description")
-                description = description_elem.text.strip()
-            except NoSuchElementException:
-                description = ""
-            
-            # Assess business characteristics
-            ai_disruptability = self.assess_ai_disruptability(description, name)
-            labor_intensity = self.assess_labor_intensity(description, "")
-            visit_frequency = self.determine_visit_frequency(description, name)
-            
-            # Calculate distance
-            distance = self.location_service.calculate_distance(address)
-            
-            return BusinessListing(
-                name=name,
-                address=address,
-                price=price,
-                earnings_multiple=0.0,
-                ownership_structure="unknown",
-                visit_frequency=visit_frequency,
-                reason_for_sale="not specified",
-                ai_disruptability=ai_disruptability,
-                labor_intensity=labor_intensity,
-                platform="DealStream",
-                listing_url=listing_url,
-                distance_miles=distance
-            )
-            
-        except Exception as e:
-            logger.warning(f"Failed to extract DealStream listing data: {e}")
-            return None
+        return rows
 
 class BusinessBrokerNetScraper(BusinessScraper):
     """Scraper for BusinessBroker.net"""
     
-    def __init__(self):
-        super().__init__()
+    platform = "BusinessBroker.net"
+    
+    def __init__(self, session: Optional[requests.Session] = None, proxies: Optional[ProxyRotator] = None):
+        super().__init__(session, proxies)
         self.base_url = "https://www.businessbroker.net"
     
     def scrape_listings(self, max_pages: int = 3) -> List[BusinessListing]:
         """Scrape business listings from BusinessBroker.net"""
-        listings = []
-        
         # Note: This is a simplified implementation
         # BusinessBroker.net often requires more complex navigation
         
         try:
-            # Use requests for initial implementation
+            # Follow the site's own next-page link, stopping at the last page
+            # or at the first page without listings
             search_url = f"{self.base_url}/businesses-for-sale/new-york"
-            response = self.session.get(search_url)
-            
-            if response.status_code == 200:
-                # Parse with BeautifulSoup
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find business listing containers
-                listing_containers = soup.find_all('div', class_='business-listing')
-                
-                for container in listing_containers:
-                    try:
-                        listing = self._extract_businessbroker_listing(container)
-                        if listing and self._meets_criteria(listing):
-                            listings.append(listing)
-                    except Exception as e:
-                        logger.warning(f"Failed to extract BusinessBroker.net listing: {e}")
-                        continue
-            
+            rows = self._scrape_static_pages(
+                search_url, max_pages,
+                item_xpath=_BUSINESSBROKER_ITEMS,
+                next_xpath=_BUSINESSBROKER_NEXT,
+                extract=self._extract_businessbroker_listing
+            ) or []
+            return self._qualifying_listings(rows)
+        
         except Exception as e:
             logger.error(f"Error scraping BusinessBroker.net: {e}")
-        
-        return listings
+            return []
     
-    def _extract_businessbroker_listing(self, container) -> Optional[BusinessListing]:
-        """Extract data from a BusinessBroker.net listing container"""
-        try:
-            # Extract basic information
-            name_elem = container.find('a', class_='business-title')
-            if not name_elem:
-                return None
-            
-            name = name_elem.text.strip()
-            listing_url = urljoin(self.base_url, name_elem.get('href', ''))
-            
-            # Extract price
-            price_elem = container.find('span', class_='price')
-            if price_elem:
-                price_text = price_elem.text.strip()
-                price = self.extract_price(price_text)
-            else:
-                price = 0
-            
-            # Extract location
-            location_elem = container.find('span', class_='location')
-            if location_elem:
-                address = location_elem.text.strip()
-            else:
-                address = "Location not specified"
-            
-            # Get description
-            description_elem = container.find('div', class_='description')
-            description = description_elem.text.strip() if description_elem else ""
-            
-            # Assess business characteristics
-            ai_disruptability = self.assess_ai_disruptability(description, name)
-            labor_intensity = self.assess_labor_intensity(description, "")
-            visit_frequency = self.determine_visit_frequency(description, name)
-            
-            # Calculate distance
-            distance = self.location_service.calculate_distance(address)
-            
-            return BusinessListing(
-                name=name,
-                address=address,
-                price=price,
-                earnings_multiple=0.0,
-                ownership_structure="unknown",
-                visit_frequency=visit_frequency,
-                reason_for_sale="not specified",
-                ai_disruptability=ai_disruptability,
-                labor_intensity=labor_intensity,
-                platform="BusinessBroker.net",
-                listing_url=listing_url,
-                distance_miles=distance
-            )
-            
-        except Exception as e:
-            logger.warning(f"Failed to extract BusinessBroker.net listing data: {e}")
+    def _extract_businessbroker_listing(self, container) -> Optional[Dict[str, str]]:
+        """Extract raw fields from a BusinessBroker.net listing parsed with lxml"""
+        name = self._xpath_text(container, _BUSINESSBROKER_NAME)
+        if not name:
             return None
+        
+        # Links were already made absolute when the page was parsed
+        return {
+            'name': name,
+            'listing_url': self._xpath_text(container, _BUSINESSBROKER_URL),
+            'price_text': self._xpath_text(container, _BUSINESSBROKER_PRICE),
+            'address': self._xpath_text(container, _BUSINESSBROKER_LOCATION),
+            'description': self._xpath_text(container, _BUSINESSBROKER_DESCRIPTION),
+            'industry': name
+        }
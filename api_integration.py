@@ -5,18 +5,54 @@ Uses legitimate APIs and services for reliable data acquisition
 """
 
 import os
+import re
+import gzip
 import json
+import time
+import hashlib
+import shelve
 import logging
+import orjson
+import pandas as pd
 import requests
+from cachetools import LRUCache, TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from dataclasses import dataclass
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# (connect, read) timeouts for API calls
+API_TIMEOUT = (3.05, 27)
+
+# Persistent cache shared across runs
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "buyingbusiness")
+
+# Parsed listings kept per integration; older entries are evicted least recently used first
+PARSED_CACHE_SIZE = 5000
+
+# Result files at least this large are written gzip-compressed
+GZIP_THRESHOLD_BYTES = 1024 * 1024
+
+def create_api_session(headers: Dict[str, str]) -> requests.Session:
+    """Create a keep-alive session with a sized connection pool and retry backoff"""
+    session = requests.Session()
+    session.headers.update(headers)
+    
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount("https://", adapter)
+    return session
+
+@dataclass(slots=True, frozen=True)
 class BusinessListing:
     """Business listing data structure"""
     name: str
@@ -39,13 +75,24 @@ class ZylaAPIIntegration:
     Real API: https://zylalabs.com/api-marketplace/real%2Bestate%2B%26%2Bhousing/bizbuysell%2Blistings%2Bdata%2Bapi/8592
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache_ttl: int = 3600):
         self.api_key = api_key
         self.base_url = "https://zylalabs.com/api"
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
+        self.session = create_api_session(self.headers)
+        
+        # In-process cache of query -> listings, backed by an on-disk shelf
+        # holding the last response (and its ETag) for each query
+        self._cache = TTLCache(maxsize=500, ttl=cache_ttl)
+        self._disk_cache_path = os.path.join(CACHE_DIR, "zyla_listings")
+        
+        # Parsed listings keyed by (id, hash of the raw dict, platform), so
+        # cached responses are not re-converted on every call while any edit
+        # to a listing is
+        self._parsed_cache: LRUCache = LRUCache(maxsize=PARSED_CACHE_SIZE)
     
     def get_listings(self, location: str = "New York", max_results: int = 100) -> List[Dict[str, Any]]:
         """
@@ -58,34 +105,85 @@ class ZylaAPIIntegration:
             logger.error("Zyla API key not provided")
             return []
         
+        price_max = 5000000  # Your price filter
+        cache_key = (location, max_results, price_max)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+        
+        disk_key = json.dumps(cache_key)
+        cached = self._read_disk_cache(disk_key)
+        
         try:
             # NOTE: Actual endpoint structure should be verified with Zyla documentation
             endpoint = f"{self.base_url}/bizbuysell-listings"
             params = {
                 "location": location,
                 "limit": max_results,
-                "price_max": 5000000,  # Your price filter
+                "price_max": price_max,
             }
             
-            response = requests.get(endpoint, headers=self.headers, params=params)
+            # Revalidate the stored copy instead of re-downloading it
+            headers = {}
+            if cached and cached.get('etag'):
+                headers["If-None-Match"] = cached['etag']
+            
+            response = self.session.get(endpoint, params=params, headers=headers, timeout=API_TIMEOUT)
             
-            if response.status_code == 200:
+            if response.status_code == 304 and cached:
+                logger.info("Listings unchanged since last request, using cached copy")
+                listings = cached['listings']
+            elif response.status_code == 200:
                 data = response.json()
-                logger.info(f"Successfully retrieved {len(data.get('listings', []))} listings")
-                return data.get('listings', [])
+                listings = data.get('listings', [])
+                logger.info(f"Successfully retrieved {len(listings)} listings")
+                
+                if 'no-store' not in response.headers.get('Cache-Control', ''):
+                    self._write_disk_cache(disk_key, {
+                        'etag': response.headers.get('ETag'),
+                        'listings': listings
+                    })
             else:
                 logger.error(f"API request failed: {response.status_code} - {response.text}")
                 return []
+            
+            self._cache[cache_key] = listings
+            return listings
                 
         except Exception as e:
             logger.error(f"Error fetching from Zyla API: {e}")
             return []
     
-    def process_listing(self, raw_listing: Dict[str, Any]) -> Optional[BusinessListing]:
+    def _read_disk_cache(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load the last stored response for a query, if any"""
+        try:
+            with shelve.open(self._disk_cache_path, flag='r') as db:
+                return db.get(key)
+        except Exception:
+            # Missing or unreadable cache file - treat as a miss
+            return None
+    
+    def _write_disk_cache(self, key: str, entry: Dict[str, Any]):
+        """Store a response for cross-process reuse"""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with shelve.open(self._disk_cache_path) as db:
+                db[key] = entry
+        except Exception as e:
+            logger.warning(f"Failed to write listings cache: {e}")
+    
+    def process_listing(self, raw_listing: Dict[str, Any],
+                        platform: str = "BizBuySell (via Zyla API)") -> Optional[BusinessListing]:
         """Convert raw API data to BusinessListing format"""
         try:
+            digest = hashlib.blake2b(orjson.dumps(raw_listing, option=orjson.OPT_SORT_KEYS),
+                                     digest_size=8).hexdigest()
+            key = (raw_listing.get('id'), digest, platform)
+            cached = self._parsed_cache.get(key)
+            if cached is not None:
+                return cached
+            
             # NOTE: Field mapping depends on actual API response structure
-            return BusinessListing(
+            listing = BusinessListing(
                 name=raw_listing.get('business_name', 'Unknown'),
                 address=raw_listing.get('location', 'Unknown'),
                 price=int(raw_listing.get('asking_price', 0)),
@@ -95,10 +193,12 @@ class ZylaAPIIntegration:
                 reason_for_sale=raw_listing.get('reason_for_sale', 'Not specified'),
                 ai_disruptability="Requires analysis",  # Would need AI assessment
                 labor_intensity="medium",  # Would need analysis
-                platform="BizBuySell (via Zyla API)",
+                platform=platform,
                 listing_url=raw_listing.get('listing_url', ''),
                 distance_miles=raw_listing.get('distance', None)
             )
+            self._parsed_cache[key] = listing
+            return listing
         except Exception as e:
             logger.warning(f"Failed to process listing: {e}")
             return None
@@ -109,14 +209,22 @@ class ApifyIntegration:
     Real service: https://apify.com/acquistion-automation/bizbuysell-scraper
     """
     
+    # Run states after which an actor run will not change again
+    TERMINAL_STATUSES = {"SUCCEEDED", "FAILED", "TIMED-OUT", "ABORTED"}
+    
     def __init__(self, api_token: str):
         self.api_token = api_token
         self.base_url = "https://api.apify.com/v2"
         self.actor_id = "acquistion-automation/bizbuysell-scraper"
+        self.headers = {"Authorization": f"Bearer {api_token}"}
+        self.session = create_api_session(self.headers)
     
-    def run_scraper(self, input_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def run_scraper(self, input_data: Dict[str, Any], timeout_s: int = 600) -> Iterable[Dict[str, Any]]:
         """
-        Run Apify scraper and get results
+        Run Apify scraper and get results, waiting up to `timeout_s` for the run
+        
+        Dataset items are streamed one at a time, so iterate the result rather
+        than holding on to it.
         """
         if not self.api_token:
             logger.error("Apify API token not provided")
@@ -125,20 +233,24 @@ class ApifyIntegration:
         try:
             # Start actor run
             run_url = f"{self.base_url}/acts/{self.actor_id}/runs"
-            headers = {"Authorization": f"Bearer {self.api_token}"}
             
-            response = requests.post(run_url, json=input_data, headers=headers)
+            response = self.session.post(run_url, json=input_data, timeout=API_TIMEOUT)
             
             if response.status_code == 201:
                 run_data = response.json()
                 run_id = run_data['data']['id']
                 
                 # Wait for completion and get results
-                # NOTE: In production, implement proper polling
                 logger.info(f"Scraper started. Run ID: {run_id}")
-                logger.info("Check Apify dashboard for results")
+                run = self._wait_for_run(run_id, timeout_s)
+                
+                if not run or run.get('status') != "SUCCEEDED":
+                    status = run.get('status') if run else "still running"
+                    logger.error(f"Scraper run {run_id} did not succeed: {status}")
+                    logger.info("Check Apify dashboard for results")
+                    return []
                 
-                return []  # Would return actual results after completion
+                return self._stream_dataset_items(run_id)
             else:
                 logger.error(f"Failed to start scraper: {response.status_code}")
                 return []
@@ -146,12 +258,67 @@ class ApifyIntegration:
         except Exception as e:
             logger.error(f"Error with Apify integration: {e}")
             return []
+    
+    def _stream_dataset_items(self, run_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield a finished run's dataset items as they arrive, one JSON line at a time"""
+        items_url = f"{self.base_url}/actor-runs/{run_id}/dataset/items"
+        
+        try:
+            with self.session.get(
+                items_url, params={"format": "jsonl", "clean": "1"}, stream=True, timeout=API_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if line:
+                        yield orjson.loads(line)
+        except Exception as e:
+            logger.error(f"Error reading Apify dataset for run {run_id}: {e}")
+    
+    def _wait_for_run(self, run_id: str, timeout_s: int) -> Optional[Dict[str, Any]]:
+        """
+        Poll an actor run until it reaches a terminal state or `timeout_s` elapses
+        
+        Each poll asks Apify to hold the request open until the run finishes
+        (`waitForFinish`, at most 60s server-side), so fast runs return on the
+        first call; between polls the client backs off from 2s up to 30s.
+        
+        This is still a blocking wait on the calling thread. An async or
+        webhook-driven wait would need an event loop or a publicly reachable
+        callback endpoint, neither of which this synchronous tracker has.
+        """
+        deadline = time.monotonic() + timeout_s
+        run_url = f"{self.base_url}/actor-runs/{run_id}"
+        delay = 2
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.error(f"Timed out after {timeout_s}s waiting for run {run_id}")
+                return None
+            
+            wait = int(min(60, remaining))
+            response = self.session.get(
+                run_url,
+                params={"waitForFinish": wait},
+                timeout=(API_TIMEOUT[0], wait + API_TIMEOUT[1])
+            )
+            response.raise_for_status()
+            run = response.json()['data']
+            
+            if run.get('status') in self.TERMINAL_STATUSES:
+                return run
+            
+            time.sleep(min(delay, max(0, deadline - time.monotonic())))
+            delay = min(delay * 2, 30)
 
 class ProductionBusinessTracker:
     """
     Production-ready business tracker using legitimate APIs
     """
     
+    # Retirement-related sale reasons, matched in a single case-insensitive scan
+    _REASON_RE = re.compile(r"retir(?:ement|ing)|succession|aging", re.IGNORECASE)
+    
     def __init__(self, zyla_key: str = None, apify_token: str = None):
         self.zyla_api = ZylaAPIIntegration(zyla_key) if zyla_key else None
         self.apify_api = ApifyIntegration(apify_token) if apify_token else None
@@ -165,6 +332,8 @@ class ProductionBusinessTracker:
     def get_business_listings(self) -> Dict[str, Any]:
         """
         Get business listings from available APIs
+        
+        `results` holds BusinessListing objects; orjson serializes them directly.
         """
         all_listings = []
         
@@ -186,8 +355,11 @@ class ProductionBusinessTracker:
                 "maxResults": 100,
                 "priceMax": 5000000
             }
-            raw_listings = self.apify_api.run_scraper(input_config)
-            # Process Apify results...
+            # Items are parsed as they stream in rather than loaded all at once
+            for raw_listing in self.apify_api.run_scraper(input_config):
+                processed = self.zyla_api.process_listing(raw_listing, platform="BizBuySell (via Apify)")
+                if processed:
+                    all_listings.append(processed)
         
         else:
             logger.error("No valid API credentials found")
@@ -201,31 +373,60 @@ class ProductionBusinessTracker:
                 ]
             }
         
+        # Drop listings syndicated more than once for the same business
+        seen = set()
+        unique_listings = []
+        for listing in all_listings:
+            key = self._dedup_key(listing)
+            if key is None or key not in seen:
+                seen.add(key)
+                unique_listings.append(listing)
+        
         # Filter and sort results
-        filtered_listings = self._filter_listings(all_listings)
-        filtered_listings.sort(key=lambda x: x.price)
+        filtered_listings = self._filter_listings(unique_listings)
         
         return {
-            "results": [asdict(listing) for listing in filtered_listings],
+            "results": filtered_listings,
             "scan_date": datetime.now().isoformat(),
             "total_found": len(all_listings),
             "after_filtering": len(filtered_listings),
             "data_source": "API"
         }
     
+    @staticmethod
+    def _dedup_key(listing: BusinessListing) -> Optional[Tuple[str, ...]]:
+        """
+        Identity of a listing across sources: its name and address, or its URL
+        when both are the 'Unknown' placeholders. None if it has neither, so
+        such listings are always kept.
+        """
+        if listing.name != 'Unknown' or listing.address != 'Unknown':
+            return (listing.name, listing.address)
+        if listing.listing_url:
+            return (listing.listing_url,)
+        return None
+    
     def _filter_listings(self, listings: List[BusinessListing]) -> List[BusinessListing]:
-        """Apply your specific filtering criteria"""
-        filtered = []
+        """Apply your specific filtering criteria, returning matches sorted by price"""
+        if not listings:
+            return []
+        
+        # Evaluate the filters column-at-a-time instead of listing-by-listing
+        frame = pd.DataFrame({
+            'price': [listing.price for listing in listings],
+            'earnings_multiple': [listing.earnings_multiple for listing in listings],
+            'reason_for_sale': [listing.reason_for_sale for listing in listings]
+        })
         
-        for listing in listings:
-            # Apply your filters from the original spec
-            if (listing.price <= 5000000 and 
-                listing.earnings_multiple <= 5.0 and
-                any(keyword in listing.reason_for_sale.lower() for keyword in 
-                    ['retirement', 'retiring', 'succession', 'aging'])):
-                filtered.append(listing)
+        # Apply your filters from the original spec
+        mask = (
+            (frame['price'] <= 5000000) &
+            (frame['earnings_multiple'] <= 5.0) &
+            frame['reason_for_sale'].str.contains(self._REASON_RE, na=False)
+        )
         
-        return filtered
+        order = frame.loc[mask].sort_values('price', kind='stable').index
+        return [listings[i] for i in order]
 
 def main():
     """
@@ -254,10 +455,16 @@ def main():
     # Get listings
     results = tracker.get_business_listings()
     
-    # Save results
+    # Save results in one write, compressing large result sets
     output_file = f"business_listings_{datetime.now().strftime('%Y%m%d')}.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    payload = orjson.dumps(
+        results,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+    )
+    if len(payload) >= GZIP_THRESHOLD_BYTES:
+        output_file += ".gz"
+        payload = gzip.compress(payload, compresslevel=6)
+    Path(output_file).write_bytes(payload)
     
     print(f"✅ Results saved to: {output_file}")
     print(f"📊 Found {results['after_filtering']} qualifying businesses")
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Shared Headless Browser Pool
+Pre-warms headless Chrome instances and hands them out to the Selenium scrapers
+"""
+
+import atexit
+import functools
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 4
+MAX_USES_PER_INSTANCE = 50
+
+@functools.lru_cache(maxsize=None)
+def chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process
+    
+    Set CHROMEDRIVER_PATH to a pinned binary to skip webdriver-manager's
+    network check entirely; otherwise the resolved path is exported there so
+    child processes reuse it.
+    """
+    path = os.environ.get("CHROMEDRIVER_PATH")
+    if path and os.path.exists(path):
+        return path
+    
+    path = ChromeDriverManager().install()
+    os.environ["CHROMEDRIVER_PATH"] = path
+    return path
+
+def build_chrome_options(javascript: bool = True) -> Options:
+    """Build the headless Chrome options shared by every pooled browser
+    
+    Images are never loaded and `driver.get` returns as soon as navigation
+    starts; callers wait for their own selector and then call `window.stop()`.
+    """
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.page_load_strategy = "none"
+    
+    prefs = {"profile.managed_default_content_settings.images": 2}
+    if not javascript:
+        prefs["profile.managed_default_content_settings.javascript"] = 2
+    chrome_options.add_experimental_option("prefs", prefs)
+    
+    return chrome_options
+
+class BrowserPool:
+    """Fixed-size pool of headless Chrome drivers, recycled after max_uses"""
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, max_uses: int = MAX_USES_PER_INSTANCE,
+                 javascript: bool = True):
+        self.size = size
+        self.max_uses = max_uses
+        self.javascript = javascript
+        self._available: "queue.Queue[webdriver.Chrome]" = queue.Queue(maxsize=size)
+        self._uses: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._started = False
+
+    def _spawn(self) -> webdriver.Chrome:
+        """Launch a new headless Chrome instance"""
+        driver = webdriver.Chrome(
+            service=Service(chromedriver_path()),
+            options=build_chrome_options(javascript=self.javascript)
+        )
+        self._uses[id(driver)] = 0
+        return driver
+
+    def start(self):
+        """Pre-warm the pool with `size` browser instances"""
+        with self._lock:
+            if self._started:
+                return
+
+            for _ in range(self.size):
+                try:
+                    self._available.put(self._spawn())
+                except Exception as e:
+                    logger.warning(f"Failed to pre-warm browser: {e}")
+
+            self._started = True
+            logger.info(f"Browser pool started with {self._available.qsize()} instances")
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = 120) -> Iterator[webdriver.Chrome]:
+        """Check out a browser for the duration of the `with` block"""
+        self.start()
+
+        try:
+            driver = self._available.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("No browser available in pool")
+
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def release(self, driver: webdriver.Chrome):
+        """Return a browser to the pool, isolating or recycling it first"""
+        uses = self._uses.get(id(driver), 0) + 1
+        self._uses[id(driver)] = uses
+
+        if uses >= self.max_uses:
+            self._quit(driver)
+            try:
+                driver = self._spawn()
+            except Exception as e:
+                logger.warning(f"Failed to respawn browser: {e}")
+                return
+        else:
+            try:
+                # Reset session state so the next scraper starts clean
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except Exception as e:
+                logger.warning(f"Browser failed to reset, replacing it: {e}")
+                self._quit(driver)
+                try:
+                    driver = self._spawn()
+                except Exception as e:
+                    logger.warning(f"Failed to respawn browser: {e}")
+                    return
+
+        self._available.put(driver)
+
+    def _quit(self, driver: webdriver.Chrome):
+        """Shut down a single browser instance"""
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error closing browser: {e}")
+
+    def close(self):
+        """Quit every idle browser in the pool"""
+        while True:
+            try:
+                driver = self._available.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(driver)
+
+        self._started = False
+
+_browser_pools: Dict[bool, BrowserPool] = {}
+_browser_pool_lock = threading.Lock()
+
+def get_browser_pool(size: int = DEFAULT_POOL_SIZE, javascript: bool = True) -> BrowserPool:
+    """Return the process-wide browser pool, creating it on first use
+    
+    Pages that render server-side can use `javascript=False` for a pool whose
+    browsers skip script execution entirely.
+    """
+    with _browser_pool_lock:
+        pool = _browser_pools.get(javascript)
+        if pool is None:
+            pool = BrowserPool(size=size, javascript=javascript)
+            _browser_pools[javascript] = pool
+            atexit.register(pool.close)
+        return pool
+
+def close_browser_pools():
+    """Quit the idle browsers of every pool; pools restart on their next use"""
+    with _browser_pool_lock:
+        pools = list(_browser_pools.values())
+    for pool in pools:
+        pool.close()
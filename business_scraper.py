@@ -4,27 +4,43 @@ Daily Business Acquisition Tracker
 Scrapes business listings from multiple platforms and generates filtered results
 """
 
-import json
+import asyncio
+import hashlib
+import itertools
+import os
 import re
+import sys
+import sqlite3
+import functools
+import multiprocessing
 import time
 import logging
+import threading
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Callable, List, Dict, Any, Iterable, Optional, Tuple
+from dataclasses import dataclass
 from urllib.parse import urljoin, urlparse
 
+import lxml.html
+import numpy as np
+import orjson
+from lxml import etree
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 from geopy.distance import geodesic
 from geopy.geocoders import Nominatim
 
+from browser_pool import build_chrome_options, chromedriver_path, close_browser_pools, get_browser_pool
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,7 +52,102 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Translation table that deletes every Latin-1 character except digits and the
+# decimal point, so prices are cleaned without running a regex per listing
+_KEEP_PRICE_CHARS = str.maketrans("", "", "".join(
+    chr(c) for c in range(256) if not (chr(c).isdigit() or chr(c) == '.')
+))
+# Fallback for the rare price string containing characters outside Latin-1
+_NON_PRICE_CHARS_RE = re.compile(r'[^\d.]')
+
+# Patterns like "4.2x", "4.2 x", "multiple: 4.2", tried in order
+_MULTIPLE_RES = [re.compile(pattern) for pattern in (
+    r'(\d+\.?\d*)\s*x',
+    r'multiple[:\s]*(\d+\.?\d*)',
+    r'(\d+\.?\d*)\s*times'
+)]
+_DIGIT_RE = re.compile(r'\d+')
+_NONWORD_RE = re.compile(r'[^\w\s]')
+
+CACHE_DIR = os.path.expanduser("~/.cache/buyingbusiness")
+
+# How each listing in a business_listings_*.json file is serialized, whether it
+# comes straight from a scan or from the listing history, so both produce the
+# same file; DashboardGenerator reads them back with orjson.loads (or ijson for
+# very large files)
+LISTINGS_JSON_OPTIONS = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_SERIALIZE_NUMPY
+
+def _keyword_re(keywords: List[str]) -> re.Pattern:
+    """One alternation that matches if any keyword occurs as a substring"""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+# Classifier keyword lists, each compiled into a single pattern so a listing's
+# text is scanned once per list instead of once per keyword
+_AI_HIGH_RISK_RE = _keyword_re([
+    'data entry', 'customer service', 'bookkeeping', 'accounting',
+    'translation', 'transcription', 'content writing', 'marketing'
+])
+_AI_LOW_RISK_RE = _keyword_re([
+    'manufacturing', 'logistics', 'construction', 'plumbing',
+    'electrical', 'specialized', 'custom', 'hands-on', 'physical'
+])
+_HIGH_LABOR_RE = _keyword_re([
+    'restaurant', 'retail', 'customer service', 'call center',
+    'hospitality', 'cleaning', 'maintenance staff'
+])
+_LOW_LABOR_RE = _keyword_re([
+    'automated', 'technology', 'software', 'equipment rental',
+    'self-service', 'online', 'digital'
+])
+_DAILY_VISIT_RE = _keyword_re(['restaurant', 'retail', 'customer service'])
+_WEEKLY_VISIT_RE = _keyword_re(['office', 'consulting', 'services'])
+_MONTHLY_VISIT_RE = _keyword_re(['rental', 'storage', 'equipment', 'property'])
+
+# Reason-for-sale filter (retirement related)
+_RETIREMENT_RE = _keyword_re(['retirement', 'retiring', 'succession', 'aging', 'health'])
+
+def _has_class(class_name: str) -> str:
+    """XPath predicate equivalent to the CSS `.class_name` selector"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+# BizBuySell search result and detail page selectors, compiled once at import
+_BIZBUYSELL_ITEMS = etree.XPath(f"//*[{_has_class('result-item')}]")
+_BIZBUYSELL_NEXT = etree.XPath(f"//a[{_has_class('next')}]/@href")
+_BIZBUYSELL_NAME = etree.XPath(f".//*[{_has_class('listing-title')}]//a")
+_BIZBUYSELL_URL = etree.XPath(f".//*[{_has_class('listing-title')}]//a/@href")
+_BIZBUYSELL_PRICE = etree.XPath(f".//*[{_has_class('price')}]")
+_BIZBUYSELL_LOCATION = etree.XPath(f".//*[{_has_class('location')}]")
+_BIZBUYSELL_JSON_LD = etree.XPath(".//script[@type='application/ld+json']/text()")
+_BIZBUYSELL_DETAIL_SELECTORS = {
+    'description': ".business-description",
+    'industry': ".industry",
+    'reason_for_sale': ".reason-for-sale",
+    'employee_count': ".employees"
+}
+_BIZBUYSELL_DETAIL_FIELDS = {
+    field: etree.XPath(f"//*[{_has_class(selector[1:])}]")
+    for field, selector in _BIZBUYSELL_DETAIL_SELECTORS.items()
+}
+
+# lxml parsers must not be shared between threads, so each scraper thread
+# lazily builds its own lean parser
+_parser_local = threading.local()
+
+def _html_parser() -> lxml.html.HTMLParser:
+    """This thread's HTML parser, which skips comments, PIs, blank text and ID indexing"""
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(
+            remove_blank_text=True, remove_comments=True, remove_pis=True, collect_ids=False
+        )
+        _parser_local.parser = parser
+    return parser
+
+def _norm_addr(address: str) -> str:
+    """Normalize an address for cache lookups: lowercase, no punctuation, single spaces"""
+    return " ".join(_NONWORD_RE.sub(" ", address.lower()).split())
+
+@dataclass(slots=True, frozen=True)
 class BusinessListing:
     name: str
     address: str
@@ -55,16 +166,65 @@ class BusinessListing:
 class LocationService:
     """Service for calculating distances from target location"""
     
-    def __init__(self):
+    # Most recently geocoded addresses loaded from disk at start-up, and how
+    # long a stored geocode stays valid before Nominatim is asked again
+    preload_rows = 4096
+    geocode_ttl_seconds = 30 * 86400
+    # Concurrent lookups in a batch, and Nominatim's usage policy of at most
+    # one request per second
+    max_geocode_workers = 8
+    nominatim_interval = 1.0
+    
+    def __init__(self, cache_path: str = os.path.join(CACHE_DIR, "geocode.sqlite")):
         self.geolocator = Nominatim(user_agent="business_acquisition_tracker")
+        
+        # Geocodes persist across runs; the same towns recur across pages,
+        # platforms and days, and Nominatim allows about one request a second
+        self._db_lock = threading.Lock()
+        self._db = self._open_cache(cache_path)
+        self._preloaded = self._load_recent()
+        self._nominatim_limiter = DomainRateLimiter(min_interval=self.nominatim_interval)
+        
+        # The target goes through the same cache, so it is geocoded once a month
         self.target_coords = self._get_target_coordinates()
     
+    def _open_cache(self, cache_path: str) -> Optional[sqlite3.Connection]:
+        """Open (creating if needed) the on-disk geocode cache"""
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            db = sqlite3.connect(cache_path, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS geocode_cache "
+                "(addr TEXT PRIMARY KEY, lat REAL, lon REAL, ts INTEGER)"
+            )
+            db.commit()
+            return db
+        except sqlite3.Error as e:
+            logger.warning(f"Geocode cache unavailable, geocoding without it: {e}")
+            return None
+    
+    def _load_recent(self) -> Dict[str, Tuple[Optional[tuple], int]]:
+        """Read the most recently geocoded, unexpired addresses (with their timestamps) into memory"""
+        if self._db is None:
+            return {}
+        
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT addr, lat, lon, ts FROM geocode_cache WHERE ts >= ? ORDER BY ts DESC LIMIT ?",
+                (self._oldest_valid_ts(), self.preload_rows)
+            ).fetchall()
+        return {addr: ((lat, lon) if lat is not None else None, ts) for addr, lat, lon, ts in rows}
+    
+    def _oldest_valid_ts(self) -> int:
+        """Timestamp before which stored geocodes are considered stale"""
+        return int(time.time()) - self.geocode_ttl_seconds
+    
     def _get_target_coordinates(self) -> tuple:
         """Get coordinates for 37 Warren Street, New York, NY 10007"""
         try:
-            location = self.geolocator.geocode("37 Warren Street, New York, NY 10007")
-            if location:
-                return (location.latitude, location.longitude)
+            coords = self._geocode(_norm_addr("37 Warren Street, New York, NY 10007"))
+            if coords:
+                return coords
             else:
                 # Fallback coordinates for Financial District, NYC
                 return (40.7112, -74.0055)
@@ -72,57 +232,558 @@ class LocationService:
             logger.warning(f"Failed to geocode target address: {e}")
             return (40.7112, -74.0055)
     
+    def _geocode(self, addr: str) -> Optional[tuple]:
+        """
+        Coordinates for a normalized address, or None if Nominatim can't place it
+        
+        Checks the preloaded rows, then the on-disk cache (ignoring entries older
+        than the TTL in both, since a scheduler keeps this service alive for
+        days), then Nominatim. Lookup failures raise so that they are retried
+        rather than cached.
+        """
+        preloaded = self._preloaded.get(addr)
+        if preloaded is not None and preloaded[1] >= self._oldest_valid_ts():
+            return preloaded[0]
+        
+        if self._db is not None:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT lat, lon FROM geocode_cache WHERE addr = ? AND ts >= ?",
+                    (addr, self._oldest_valid_ts())
+                ).fetchone()
+            if row:
+                return (row[0], row[1]) if row[0] is not None else None
+        
+        self._nominatim_limiter.wait("https://nominatim.openstreetmap.org")
+        location = self.geolocator.geocode(addr)
+        coords = (location.latitude, location.longitude) if location else None
+        
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO geocode_cache (addr, lat, lon, ts) VALUES (?, ?, ?, ?)",
+                    (addr, coords[0] if coords else None, coords[1] if coords else None, int(time.time()))
+                )
+                self._db.commit()
+        return coords
+    
     def calculate_distance(self, address: str) -> Optional[float]:
         """Calculate distance from target location to given address"""
         try:
-            location = self.geolocator.geocode(address)
-            if location:
-                distance = geodesic(
-                    self.target_coords,
-                    (location.latitude, location.longitude)
-                ).miles
+            coords = self._geocode(_norm_addr(address))
+            if coords:
+                distance = geodesic(self.target_coords, coords).miles
                 return round(distance, 1)
         except Exception as e:
             logger.warning(f"Failed to calculate distance for {address}: {e}")
         return None
+    
+    def calculate_distances(self, addresses: List[str]) -> List[Optional[float]]:
+        """
+        Calculate distances for a batch of addresses, geocoding each unique address once
+        
+        Lookups run concurrently so cache hits and in-flight requests overlap;
+        the limiter still spaces Nominatim requests to one per second.
+        """
+        unique_addresses = [address for address in dict.fromkeys(addresses) if address]
+        
+        with ThreadPoolExecutor(max_workers=self.max_geocode_workers) as executor:
+            distances = dict(zip(unique_addresses, executor.map(self.calculate_distance, unique_addresses)))
+        return [distances.get(address) for address in addresses]
+
+class DomainRateLimiter:
+    """Enforces a minimum gap between request start times to the same domain"""
+    
+    def __init__(self, min_interval: float = 1.5):
+        self.min_interval = min_interval
+        self._last_request: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def wait(self, url: str):
+        """Block until a request to the URL's domain is allowed"""
+        domain = urlparse(url).netloc
+        
+        # Reserve the next free slot under the lock, then sleep outside it so
+        # requests to other domains are never held up
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._last_request.get(domain, 0.0) + self.min_interval)
+            self._last_request[domain] = slot
+        
+        if slot > now:
+            time.sleep(slot - now)
+
+# Shared by all scrapers so concurrent requests to one site stay polite
+rate_limiter = DomainRateLimiter()
+
+class ConditionalPageStore:
+    """
+    On-disk map of page URL to its validators and the rows parsed from it
+    
+    Lets daily reruns send If-None-Match / If-Modified-Since and reuse the
+    stored rows when the site answers 304 Not Modified, or when it sends no
+    validators but the body hashes the same as last time. Pages fetched within
+    `ttl_seconds` are served from the store without any request; setting
+    `force_refresh` bypasses the store entirely.
+    """
+    
+    ttl_seconds = 12 * 60 * 60
+    force_refresh = False
+    
+    def __init__(self, path: str = os.path.join(CACHE_DIR, "etags.json")):
+        self.path = path
+        self._pages: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the store from disk on first use"""
+        if self._pages is None:
+            try:
+                with open(self.path, 'rb') as f:
+                    self._pages = orjson.loads(f.read())
+            except (OSError, ValueError):
+                self._pages = {}
+        return self._pages
+    
+    def is_fresh(self, url: str) -> bool:
+        """Whether a page was fetched recently enough to skip the request"""
+        if self.force_refresh:
+            return False
+        with self._lock:
+            entry = self._load().get(url)
+        return entry is not None and time.time() - entry.get('fetched_at', 0) < self.ttl_seconds
+    
+    def headers_for(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for a previously fetched page"""
+        if self.force_refresh:
+            return {}
+        with self._lock:
+            entry = self._load().get(url, {})
+        
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    @staticmethod
+    def _body_hash(response: requests.Response) -> str:
+        """Fingerprint of a downloaded page body"""
+        return hashlib.blake2b(response.content, digest_size=16).hexdigest()
+    
+    def cached_page(self, url: str, response: Optional[requests.Response]) -> Optional[Dict[str, Any]]:
+        """
+        The stored entry for a page that has not changed since it was parsed
+        
+        Entries hold the parsed `rows` and the `next_url` found on the page.
+        `response` is None when the page was not requested because it is still
+        fresh. Returns None when the page must be parsed again.
+        """
+        if self.force_refresh:
+            return None
+        if response is None:
+            return self._load_entry(url) if self.is_fresh(url) else None
+        if response.status_code not in (200, 304):
+            return None
+        
+        entry = self._load_entry(url)
+        if entry is None:
+            return None
+        
+        if response.status_code == 304 or entry.get('body_hash') == self._body_hash(response):
+            return entry
+        return None
+    
+    def _load_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        """The stored entry for a page, if any"""
+        with self._lock:
+            return self._load().get(url)
+    
+    def update(self, url: str, response: requests.Response, rows: List[Dict[str, str]],
+               next_url: Optional[str] = None):
+        """Remember a freshly downloaded page with its validators and parsed rows"""
+        entry = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body_hash': self._body_hash(response),
+            'rows': rows,
+            'next_url': next_url,
+            'fetched_at': time.time()
+        }
+        
+        with self._lock:
+            self._load()[url] = entry
+    
+    def save(self):
+        """Write the store back to disk"""
+        with self._lock:
+            if self._pages is None:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(self.path, 'wb') as f:
+                    f.write(orjson.dumps(self._pages))
+            except OSError as e:
+                logger.warning(f"Failed to save page cache: {e}")
+
+page_store = ConditionalPageStore()
+
+class ProxyRotator:
+    """Round-robin over outbound proxies, one `proxies` mapping per request"""
+    
+    def __init__(self, proxy_urls: List[str]):
+        self.proxy_urls = proxy_urls
+        self._proxies = itertools.cycle([{'http': url, 'https': url} for url in proxy_urls])
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_env(cls, var: str = "PROXY_URLS") -> Optional['ProxyRotator']:
+        """Build a rotator from a comma-separated list of proxy URLs, if one is set"""
+        proxy_urls = [url.strip() for url in os.environ.get(var, "").split(",") if url.strip()]
+        return cls(proxy_urls) if proxy_urls else None
+    
+    def next(self) -> Dict[str, str]:
+        """The proxies to use for the next request"""
+        with self._lock:
+            return next(self._proxies)
 
 class BusinessScraper:
     """Base class for business listing scrapers"""
     
-    def __init__(self):
-        self.location_service = LocationService()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+    platform = "Unknown"
+    
+    # Listing criteria
+    max_price = 5000000
+    max_distance_miles = 50
+    max_earnings_multiple = 5.0
+    
+    # Batches at least this large are classified in worker processes; below it
+    # the cost of starting the pool outweighs the keyword scans it parallelizes
+    process_pool_threshold = 500
+    
+    # Shared by every scraper instance: one connection pool and one geocode cache
+    _session: Optional[requests.Session] = None
+    _location_service: Optional[LocationService] = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, session: Optional[requests.Session] = None, proxies: Optional[ProxyRotator] = None):
+        self.location_service = self.get_location_service()
+        self.session = session if session is not None else self.get_session()
+        self.proxies = proxies
+    
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """Return the keep-alive HTTP session shared by all scrapers"""
+        with BusinessScraper._shared_lock:
+            if BusinessScraper._session is None:
+                session = requests.Session()
+                session.headers.update({
+                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+                    'Accept-Encoding': 'gzip, deflate',
+                    'Connection': 'keep-alive'
+                })
+                
+                # Sized for the concurrent page fetches of every scraper thread
+                adapter = HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=32,
+                    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                BusinessScraper._session = session
+            
+            return BusinessScraper._session
+    
+    @classmethod
+    def get_location_service(cls) -> LocationService:
+        """Return the location service (and its distance cache) shared by all scrapers"""
+        with BusinessScraper._shared_lock:
+            if BusinessScraper._location_service is None:
+                BusinessScraper._location_service = LocationService()
+            
+            return BusinessScraper._location_service
     
     def setup_selenium_driver(self) -> webdriver.Chrome:
-        """Setup headless Chrome driver"""
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
+        """Setup a standalone headless Chrome driver
         
+        Prefer `get_browser_pool().acquire()` so browsers are reused across scrapers.
+        """
         driver = webdriver.Chrome(
-            ChromeDriverManager().install(),
-            options=chrome_options
+            service=Service(chromedriver_path()),
+            options=build_chrome_options()
         )
         return driver
     
+    def wait_for_listings(self, driver: webdriver.Chrome, class_name: str, timeout: int = 10):
+        """Wait until listing elements are present, then stop the rest of the page load"""
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CLASS_NAME, class_name))
+        )
+        driver.execute_script("window.stop();")
+    
+    def click_next_page(self, driver: webdriver.Chrome, next_selector: str, item_selector: str,
+                        timeout: int = 10) -> bool:
+        """
+        Click the next-page control and wait until the current results are replaced
+        
+        Returns False when there is no enabled next page or it did not load in time.
+        """
+        try:
+            next_button = driver.find_element(By.CSS_SELECTOR, next_selector)
+            if not next_button.is_enabled():
+                return False
+            
+            current_item = driver.find_element(By.CSS_SELECTOR, item_selector)
+            driver.execute_script("arguments[0].click();", next_button)
+            WebDriverWait(driver, timeout).until(EC.staleness_of(current_item))
+            return True
+        except NoSuchElementException:
+            return False
+        except TimeoutException:
+            logger.warning(f"Next {self.platform} page did not load within {timeout}s")
+            return False
+    
+    # Reads every listing card on the page and returns its fields in one
+    # WebDriver round-trip instead of several find_element calls per card
+    _EXTRACT_LISTINGS_JS = """
+        const [itemSelector, titleSelector, fieldSelectors] = arguments;
+        const textOf = node => node ? node.innerText.trim() : '';
+        return Array.from(document.querySelectorAll(itemSelector)).map(el => {
+            const link = el.querySelector(titleSelector);
+            const row = {name: textOf(link), listing_url: link ? link.href : ''};
+            for (const [field, selector] of Object.entries(fieldSelectors)) {
+                row[field] = textOf(el.querySelector(selector));
+            }
+            return row;
+        }).filter(row => row.name);
+    """
+    
+    def extract_listings_js(self, driver: webdriver.Chrome, item_selector: str, title_selector: str,
+                            field_selectors: Dict[str, str]) -> List[Dict[str, str]]:
+        """Extract raw fields for all listings on the current page with a single script call"""
+        return driver.execute_script(self._EXTRACT_LISTINGS_JS, item_selector, title_selector, field_selectors)
+    
+    # Same idea for a detail page: every field's text in one round-trip
+    _EXTRACT_FIELDS_JS = """
+        const fieldSelectors = arguments[0];
+        const row = {};
+        for (const [field, selector] of Object.entries(fieldSelectors)) {
+            const node = document.querySelector(selector);
+            row[field] = node ? node.innerText.trim() : '';
+        }
+        return row;
+    """
+    
+    def extract_fields_js(self, driver: webdriver.Chrome, field_selectors: Dict[str, str]) -> Dict[str, str]:
+        """Extract the text of several page-level fields with a single script call"""
+        return driver.execute_script(self._EXTRACT_FIELDS_JS, field_selectors)
+    
+    def _fetch_static(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
+        """Fetch a page over the shared keep-alive session, through the next proxy if rotating"""
+        rate_limiter.wait(url)
+        proxies = self.proxies.next() if self.proxies is not None else None
+        try:
+            return self.session.get(url, headers=headers, proxies=proxies, timeout=15)
+        except requests.RequestException as e:
+            logger.warning(f"Failed to fetch {url}: {e}")
+            return None
+    
+    def _parse_static(self, response: Optional[requests.Response]) -> Optional[lxml.html.HtmlElement]:
+        """Parse a fetched page with lxml, or return None if it was blocked or empty"""
+        if response is None or response.status_code != 200 or not response.content.strip():
+            return None
+        
+        tree = lxml.html.fromstring(response.content, parser=_html_parser())
+        tree.make_links_absolute(response.url)
+        return tree
+    
+    def _scrape_static_pages(self, search_url: str, max_pages: int, item_xpath: etree.XPath,
+                             next_xpath: etree.XPath, extract: Callable) -> Optional[List[Dict[str, str]]]:
+        """
+        Scrape paginated search results without a browser
+        
+        Returns the raw field rows produced by `extract` for every listing element,
+        or None when the first page is blocked or has no listings (likely rendered
+        client-side), in which case the caller should fall back to Selenium.
+        """
+        rows = []
+        url = search_url
+        
+        try:
+            for page in range(max_pages):
+                logger.info(f"Scraping {self.platform} page {page + 1}")
+                
+                # Serve recent pages from the store; revalidate older ones
+                if page_store.is_fresh(url):
+                    response = None
+                else:
+                    response = self._fetch_static(url, headers=page_store.headers_for(url))
+                cached = page_store.cached_page(url, response)
+                if cached is not None:
+                    logger.info(f"{self.platform} page {page + 1} unchanged, using cached listings")
+                    rows.extend(cached['rows'])
+                    next_url = cached.get('next_url')
+                else:
+                    tree = self._parse_static(response)
+                    elements = item_xpath(tree) if tree is not None else []
+                    if not elements:
+                        return None if page == 0 else rows
+                    
+                    page_rows = []
+                    for element in elements:
+                        try:
+                            row = extract(element)
+                            if row:
+                                page_rows.append(row)
+                        except Exception as e:
+                            logger.warning(f"Failed to extract {self.platform} listing: {e}")
+                    
+                    next_links = next_xpath(tree)
+                    next_url = next_links[0] if next_links else None
+                    page_store.update(url, response, page_rows, next_url)
+                    rows.extend(page_rows)
+                
+                if not next_url:
+                    break
+                url = next_url
+        finally:
+            page_store.save()
+        
+        return rows
+    
+    def _qualifying_listings(self, rows: List[Dict[str, str]]) -> List[BusinessListing]:
+        """
+        Build the listings that meet the criteria from raw scraped fields
+        
+        Price and retirement keywords are checked on the scraped text first; only
+        the sale-reason field is searched, so a listing without one fails. Only
+        the survivors are assessed and geocoded, in one batch. Both criteria
+        passes are evaluated as NumPy masks over the whole batch.
+        """
+        if not rows:
+            return []
+        
+        prices = np.fromiter(
+            (self.extract_price(row.get('price_text', '')) for row in rows), dtype=np.int64, count=len(rows)
+        )
+        sale_texts = [row.get('reason_for_sale') or '' for row in rows]
+        keep = np.flatnonzero(self._cheap_criteria_mask(prices, sale_texts))
+        candidates = [rows[i] for i in keep]
+        candidate_prices = prices[keep]
+        
+        distances = self.location_service.calculate_distances(
+            [row.get('address', '') for row in candidates]
+        )
+        assessments = self._assess_rows(candidates)
+        
+        built = [
+            self._create_listing(row, int(price), distance, assessment)
+            for row, price, distance, assessment in zip(candidates, candidate_prices, distances, assessments)
+        ]
+        listings = [listing for listing in built if listing]
+        if not listings:
+            return []
+        
+        return [listing for listing, keep in zip(listings, self._full_criteria_mask(listings)) if keep]
+    
+    def _cheap_criteria_mask(self, prices: np.ndarray, sale_texts: List[str]) -> np.ndarray:
+        """Mask of listings priced within max_price whose reason for sale mentions retirement"""
+        retirement = np.fromiter(
+            (_RETIREMENT_RE.search(text.lower()) is not None for text in sale_texts),
+            dtype=bool, count=len(sale_texts)
+        )
+        return (prices <= self.max_price) & retirement
+    
+    def _full_criteria_mask(self, listings: List[BusinessListing]) -> np.ndarray:
+        """Mask of built listings within max_distance_miles and max_earnings_multiple"""
+        distances = np.array(
+            [np.nan if listing.distance_miles is None else listing.distance_miles for listing in listings],
+            dtype=float
+        )
+        multiples = np.fromiter(
+            (listing.earnings_multiple for listing in listings), dtype=float, count=len(listings)
+        )
+        # Unknown distances pass, as do multiples of 0 (not available)
+        return (np.isnan(distances) | (distances <= self.max_distance_miles)) & (multiples <= self.max_earnings_multiple)
+    
+    def _assess_rows(self, rows: List[Dict[str, str]]) -> List[Tuple[str, str, str]]:
+        """
+        Classify each row as (ai_disruptability, labor_intensity, visit_frequency)
+        
+        The keyword scans are CPU-bound, so large batches are spread across a
+        process pool instead of competing for the GIL with the scraper threads.
+        """
+        items = [
+            (row.get('description', ''), row.get('industry', ''), row.get('employee_count', ''))
+            for row in rows
+        ]
+        if len(items) < self.process_pool_threshold:
+            return [_assess_one(item) for item in items]
+        
+        # Spawn rather than fork: scrapers run on threads that may hold locks
+        try:
+            with multiprocessing.get_context("spawn").Pool(os.cpu_count()) as pool:
+                return list(pool.imap(_assess_one, items, chunksize=64))
+        except Exception as e:
+            logger.warning(f"Process pool classification failed, running in-process: {e}")
+            return [_assess_one(item) for item in items]
+    
+    def _create_listing(self, row: Dict[str, str], price: int, distance: Optional[float],
+                        assessment: Tuple[str, str, str]) -> Optional[BusinessListing]:
+        """Build a BusinessListing from raw scraped fields and their assessment"""
+        try:
+            ai_disruptability, labor_intensity, visit_frequency = assessment
+            
+            return BusinessListing(
+                name=row['name'],
+                address=row.get('address') or "Location not specified",
+                price=price,
+                earnings_multiple=0.0,  # Would need detailed page scraping
+                ownership_structure="unknown",
+                visit_frequency=visit_frequency,
+                reason_for_sale=row.get('reason_for_sale') or "not specified",
+                ai_disruptability=ai_disruptability,
+                labor_intensity=labor_intensity,
+                platform=self.platform,
+                listing_url=row.get('listing_url', ''),
+                distance_miles=distance
+            )
+        
+        except Exception as e:
+            logger.warning(f"Failed to create {self.platform} listing: {e}")
+            return None
+    
+    @staticmethod
+    def _xpath_text(element, path: etree.XPath) -> str:
+        """Return the stripped text (or attribute value) of the first precompiled XPath match"""
+        matches = path(element)
+        if not matches:
+            return ""
+        
+        match = matches[0]
+        return (match if isinstance(match, str) else match.text_content()).strip()
+    
     def extract_price(self, price_text: str) -> int:
-        """Extract numeric price from text"""
+        """
+        Extract numeric price from text
+        
+        Prices are whole dollars: anything after the decimal point is dropped,
+        and the digits are parsed as an int directly, never through float.
+        """
         if not price_text:
             return 0
         
-        # Remove common currency symbols and text
-        price_text = re.sub(r'[^\d,.]', '', price_text)
-        price_text = price_text.replace(',', '')
+        # Remove common currency symbols, separators and text
+        price_text = price_text.translate(_KEEP_PRICE_CHARS)
+        if not price_text.isascii():
+            price_text = _NON_PRICE_CHARS_RE.sub('', price_text)
         
+        dollars = price_text.partition('.')[0]
         try:
-            return int(float(price_text))
-        except (ValueError, TypeError):
+            return int(dollars) if dollars else 0
+        except ValueError:
             return 0
     
     def extract_earnings_multiple(self, text: str) -> float:
@@ -130,15 +791,9 @@ class BusinessScraper:
         if not text:
             return 0.0
         
-        # Look for patterns like "4.2x", "4.2 x", "multiple: 4.2"
-        patterns = [
-            r'(\d+\.?\d*)\s*x',
-            r'multiple[:\s]*(\d+\.?\d*)',
-            r'(\d+\.?\d*)\s*times'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
+        text_lower = text.lower()
+        for pattern in _MULTIPLE_RES:
+            match = pattern.search(text_lower)
             if match:
                 try:
                     return float(match.group(1))
@@ -147,73 +802,63 @@ class BusinessScraper:
         
         return 0.0
     
-    def assess_ai_disruptability(self, description: str, industry: str) -> str:
+    # The classifiers are pure functions of their text inputs, and listings in
+    # one industry often repeat the same boilerplate, so results are memoized
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def assess_ai_disruptability(description: str, industry: str) -> str:
         """Assess AI disruption risk based on business description"""
-        description_lower = description.lower()
-        industry_lower = industry.lower()
-        
-        high_risk_keywords = [
-            'data entry', 'customer service', 'bookkeeping', 'accounting',
-            'translation', 'transcription', 'content writing', 'marketing'
-        ]
-        
-        low_risk_keywords = [
-            'manufacturing', 'logistics', 'construction', 'plumbing',
-            'electrical', 'specialized', 'custom', 'hands-on', 'physical'
-        ]
-        
-        full_text = f"{description_lower} {industry_lower}"
+        full_text = f"{description.lower()} {industry.lower()}"
         
-        if any(keyword in full_text for keyword in high_risk_keywords):
+        if _AI_HIGH_RISK_RE.search(full_text):
             return "High risk - involves routine tasks easily automated"
-        elif any(keyword in full_text for keyword in low_risk_keywords):
+        elif _AI_LOW_RISK_RE.search(full_text):
             return "Low risk - requires physical presence or specialized expertise"
         else:
             return "Medium risk - requires further analysis"
     
-    def assess_labor_intensity(self, description: str, employee_count: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def assess_labor_intensity(description: str, employee_count: str) -> str:
         """Assess labor intensity based on description and employee count"""
         try:
-            emp_count = int(re.search(r'\d+', employee_count or '0').group())
+            emp_count = int(_DIGIT_RE.search(employee_count or '0').group())
         except (AttributeError, ValueError):
             emp_count = 0
         
         description_lower = description.lower()
         
-        high_labor_keywords = [
-            'restaurant', 'retail', 'customer service', 'call center',
-            'hospitality', 'cleaning', 'maintenance staff'
-        ]
-        
-        low_labor_keywords = [
-            'automated', 'technology', 'software', 'equipment rental',
-            'self-service', 'online', 'digital'
-        ]
-        
-        if emp_count > 20 or any(keyword in description_lower for keyword in high_labor_keywords):
+        if emp_count > 20 or _HIGH_LABOR_RE.search(description_lower):
             return "high"
-        elif emp_count < 5 or any(keyword in description_lower for keyword in low_labor_keywords):
+        elif emp_count < 5 or _LOW_LABOR_RE.search(description_lower):
             return "low"
         else:
             return "medium"
     
-    def determine_visit_frequency(self, description: str, business_type: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def determine_visit_frequency(description: str, business_type: str) -> str:
         """Determine required visit frequency based on business characteristics"""
         full_text = f"{description.lower()} {business_type.lower()}"
         
-        daily_keywords = ['restaurant', 'retail', 'customer service']
-        weekly_keywords = ['office', 'consulting', 'services']
-        monthly_keywords = ['rental', 'storage', 'equipment', 'property']
-        
-        if any(keyword in full_text for keyword in daily_keywords):
+        if _DAILY_VISIT_RE.search(full_text):
             return "daily"
-        elif any(keyword in full_text for keyword in weekly_keywords):
+        elif _WEEKLY_VISIT_RE.search(full_text):
             return "weekly"
-        elif any(keyword in full_text for keyword in monthly_keywords):
+        elif _MONTHLY_VISIT_RE.search(full_text):
             return "monthly"
         else:
             return "weekly"  # Default assumption
 
+def _assess_one(item: Tuple[str, str, str]) -> Tuple[str, str, str]:
+    """Classify one (description, industry, employee_count); module-level so worker processes can run it"""
+    description, industry, employee_count = item
+    return (
+        BusinessScraper.assess_ai_disruptability(description, industry),
+        BusinessScraper.assess_labor_intensity(description, employee_count),
+        BusinessScraper.determine_visit_frequency(description, industry)
+    )
+
 class BizBuySellScraper(BusinessScraper):
     """
     Scraper for BizBuySell.com
@@ -225,8 +870,13 @@ class BizBuySellScraper(BusinessScraper):
     4. Implement proper rate limiting and error handling
     """
     
-    def __init__(self):
-        super().__init__()
+    platform = "BizBuySell"
+    
+    # Scraping stays off until the Terms of Service have been reviewed
+    demo_mode = True
+    
+    def __init__(self, session: Optional[requests.Session] = None, proxies: Optional[ProxyRotator] = None):
+        super().__init__(session, proxies)
         self.base_url = "https://www.bizbuysell.com"
         self.terms_url = "https://www.bizbuysell.com/terms-of-use"
         self.robots_url = "https://www.bizbuysell.com/robots.txt"
@@ -242,156 +892,250 @@ class BizBuySellScraper(BusinessScraper):
         3. Test thoroughly
         4. Consider using APIs instead
         """
-        listings = []
-        
         # Check Terms of Service compliance first
         logger.warning("Please ensure you have reviewed BizBuySell's Terms of Service")
         logger.warning(f"Terms: {self.terms_url}")
         logger.warning(f"Robots.txt: {self.robots_url}")
         
         # For demonstration, return empty list with warning
-        logger.warning("Scraping disabled in demo mode. Use API integration instead.")
-        return []
-        
-        # The following code is commented out as it's for demonstration only:
-        """
-        driver = self.setup_selenium_driver()
+        if self.demo_mode:
+            logger.warning("Scraping disabled in demo mode. Use API integration instead.")
+            return []
         
         try:
             # NOTE: Actual URL structure may differ - verify current site structure
             search_url = f"{self.base_url}/businesses-for-sale/New-York/New-York"
-            driver.get(search_url)
             
-            # NOTE: CSS selectors are examples - inspect actual site for correct ones
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "result-item"))
-            )
+            # Search results are static markup, so no browser is needed for them
+            rows = self._scrape_static_pages(
+                search_url, max_pages,
+                item_xpath=_BIZBUYSELL_ITEMS,
+                next_xpath=_BIZBUYSELL_NEXT,
+                extract=self._extract_bizbuysell_static
+            ) or []
             
-            for page in range(max_pages):
-                logger.info(f"Scraping BizBuySell page {page + 1}")
-                
-                # Find all listing elements
-                listing_elements = driver.find_elements(By.CLASS_NAME, "result-item")
-                
-                for element in listing_elements:
-                    try:
-                        listing = self._extract_listing_data(element, driver)
-                        if listing and self._meets_criteria(listing):
-                            listings.append(listing)
-                    except Exception as e:
-                        logger.warning(f"Failed to extract listing: {e}")
-                        continue
-                
-                # Navigate to next page
-                try:
-                    next_button = driver.find_element(By.CSS_SELECTOR, "a.next")
-                    if next_button.is_enabled():
-                        driver.execute_script("arguments[0].click();", next_button)
-                        time.sleep(3)
-                    else:
-                        break
-                except NoSuchElementException:
-                    break
+            # Only open the detail pages of listings within the price ceiling
+            rows = [row for row in rows if self.extract_price(row['price_text']) <= self.max_price]
+            self._add_listing_details(rows)
+            
+            return self._qualifying_listings(rows)
         
         except Exception as e:
             logger.error(f"Error scraping BizBuySell: {e}")
+            return []
+    
+    def _extract_bizbuysell_static(self, element) -> Optional[Dict[str, str]]:
+        """Extract raw fields from a BizBuySell search result parsed with lxml"""
+        row = self._extract_bizbuysell_json_ld(element)
+        if row:
+            return row
         
-        finally:
-            driver.quit()
+        name = self._xpath_text(element, _BIZBUYSELL_NAME)
+        if not name:
+            return None
         
-        return listings
+        return {
+            'name': name,
+            'listing_url': self._xpath_text(element, _BIZBUYSELL_URL),
+            'price_text': self._xpath_text(element, _BIZBUYSELL_PRICE),
+            'address': self._xpath_text(element, _BIZBUYSELL_LOCATION)
+        }
     
-    def _extract_listing_data(self, element, driver) -> Optional[BusinessListing]:
-        """Extract data from a single listing element"""
-        try:
-            # Extract basic information
-            name_elem = element.find_element(By.CSS_SELECTOR, ".listing-title a")
-            name = name_elem.text.strip()
-            listing_url = name_elem.get_attribute("href")
-            
-            # Extract price
-            price_elem = element.find_element(By.CSS_SELECTOR, ".price")
-            price_text = price_elem.text.strip()
-            price = self.extract_price(price_text)
-            
-            # Extract location
-            location_elem = element.find_element(By.CSS_SELECTOR, ".location")
-            address = location_elem.text.strip()
-            
-            # Get additional details by visiting the listing page
-            current_url = driver.current_url
-            driver.get(listing_url)
-            time.sleep(2)
-            
-            # Extract detailed information
-            description = self._get_text_safe(driver, ".business-description")
-            industry = self._get_text_safe(driver, ".industry")
-            reason_for_sale = self._get_text_safe(driver, ".reason-for-sale")
-            employee_count = self._get_text_safe(driver, ".employees")
-            
-            # Calculate earnings multiple (this would need to be extracted from financials)
-            earnings_multiple = 0.0  # Placeholder - would need more sophisticated extraction
+    def _extract_bizbuysell_json_ld(self, element) -> Optional[Dict[str, str]]:
+        """
+        Read a result card's embedded JSON-LD, if it has any
+        
+        Cards that carry structured data already include the description, so
+        their detail pages don't need to be opened.
+        """
+        for script in _BIZBUYSELL_JSON_LD(element):
+            try:
+                data = orjson.loads(script)
+            except orjson.JSONDecodeError:
+                continue
+            if not isinstance(data, dict) or not data.get('name'):
+                continue
             
-            # Assess business characteristics
-            ai_disruptability = self.assess_ai_disruptability(description, industry)
-            labor_intensity = self.assess_labor_intensity(description, employee_count)
-            visit_frequency = self.determine_visit_frequency(description, industry)
+            offers = data.get('offers') or {}
+            if isinstance(offers, list):
+                offers = offers[0] if offers else {}
             
-            # Calculate distance
-            distance = self.location_service.calculate_distance(address)
+            address = data.get('address') or ''
+            if isinstance(address, dict):
+                address = ", ".join(
+                    address[part] for part in ('streetAddress', 'addressLocality', 'addressRegion')
+                    if address.get(part)
+                )
             
-            # Go back to search results
-            driver.get(current_url)
-            time.sleep(2)
+            return {
+                'name': data['name'].strip(),
+                'listing_url': urljoin(self.base_url, data.get('url', '')),
+                'price_text': str(offers.get('price', '')),
+                'address': address,
+                'description': data.get('description', '')
+            }
+        
+        return None
+    
+    def _add_listing_details(self, rows: List[Dict[str, str]]):
+        """
+        Fill in each row's description, industry, sale reason and employee count
+        
+        Detail pages are fetched over the shared session; a pooled browser is
+        checked out only if one of them needs JavaScript, and is then reused for
+        the rest of the rows.
+        """
+        with ExitStack() as stack:
+            driver = None
             
-            return BusinessListing(
-                name=name,
-                address=address,
-                price=price,
-                earnings_multiple=earnings_multiple,
-                ownership_structure="unknown",  # Would need specific extraction
-                visit_frequency=visit_frequency,
-                reason_for_sale=reason_for_sale or "not specified",
-                ai_disruptability=ai_disruptability,
-                labor_intensity=labor_intensity,
-                platform="BizBuySell",
-                listing_url=listing_url,
-                distance_miles=distance
+            for row in rows:
+                # Already filled in from the card's JSON-LD
+                if row.get('description'):
+                    continue
+                
+                try:
+                    tree = self._parse_static(self._fetch_static(row['listing_url']))
+                    if tree is not None:
+                        row.update({
+                            field: self._xpath_text(tree, path)
+                            for field, path in _BIZBUYSELL_DETAIL_FIELDS.items()
+                        })
+                        continue
+                    
+                    if driver is None:
+                        driver = stack.enter_context(get_browser_pool().acquire())
+                    
+                    driver.get(row['listing_url'])
+                    self.wait_for_listings(driver, "business-description", timeout=10)
+                    row.update(self.extract_fields_js(driver, _BIZBUYSELL_DETAIL_SELECTORS))
+                
+                except Exception as e:
+                    logger.warning(f"Failed to get BizBuySell listing details for {row['name']}: {e}")
+
+def _write_listings_json(path: str, payloads: Iterable[bytes], metadata: Dict[str, Any]) -> int:
+    """
+    Write a listings file from already-serialized listings, followed by the scan fields
+    
+    unique_listings is set from the listings actually written. Returns that count.
+    """
+    count = 0
+    with open(path, 'wb') as f:
+        f.write(b'{"results":[')
+        for payload in payloads:
+            if count:
+                f.write(b",")
+            f.write(payload)
+            count += 1
+        f.write(b"],")
+        fields = {**metadata, "unique_listings": count}
+        f.write(orjson.dumps(fields, option=LISTINGS_JSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)[1:])
+    return count
+
+class ListingHistory:
+    """
+    Rolling SQLite record of every listing seen across daily scans
+    
+    Each listing is stored once under its URL with first_seen / last_seen scan
+    timestamps and a hash of its content, so a scan only rewrites the listings
+    that are new or changed and merely touches last_seen for the rest. The
+    daily JSON is then streamed out of the rows last seen by that scan.
+    """
+    
+    # Listing URLs looked up per query, kept under SQLite's bound-parameter limit
+    lookup_batch_size = 500
+    
+    def __init__(self, path: str = os.path.join(CACHE_DIR, "listings.sqlite")):
+        self._db = self._open(path)
+    
+    def _open(self, path: str) -> Optional[sqlite3.Connection]:
+        """Open (creating if needed) the listing history database"""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            db = sqlite3.connect(path)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS listings "
+                "(url TEXT PRIMARY KEY, payload TEXT, first_seen TEXT, last_seen TEXT, hash TEXT)"
             )
-            
-        except Exception as e:
-            logger.warning(f"Failed to extract listing data: {e}")
+            db.execute("CREATE INDEX IF NOT EXISTS listings_last_seen ON listings (last_seen)")
+            db.commit()
+            return db
+        except sqlite3.Error as e:
+            logger.warning(f"Listing history unavailable, not recording this scan: {e}")
             return None
     
-    def _get_text_safe(self, driver, selector: str) -> str:
-        """Safely extract text from an element"""
-        try:
-            element = driver.find_element(By.CSS_SELECTOR, selector)
-            return element.text.strip()
-        except NoSuchElementException:
-            return ""
+    def _known_hashes(self, urls: List[str]) -> Dict[str, str]:
+        """Stored content hashes for just these listing URLs"""
+        known = {}
+        for start in range(0, len(urls), self.lookup_batch_size):
+            batch = urls[start:start + self.lookup_batch_size]
+            placeholders = ", ".join("?" * len(batch))
+            known.update(self._db.execute(f"SELECT url, hash FROM listings WHERE url IN ({placeholders})", batch))
+        return known
     
-    def _meets_criteria(self, listing: BusinessListing) -> bool:
-        """Check if listing meets the specified criteria"""
-        # Price filter
-        if listing.price > 5000000:
-            return False
+    def record(self, listings: List[BusinessListing], scan_id: str) -> Optional[int]:
+        """
+        Store new or changed listings and mark the rest as seen by `scan_id`
         
-        # Distance filter
-        if listing.distance_miles and listing.distance_miles > 50:
-            return False
+        Returns the number of listings written, or None if the history could
+        not be updated.
+        """
+        if self._db is None:
+            return None
         
-        # Earnings multiple filter (when available)
-        if listing.earnings_multiple > 5.0 and listing.earnings_multiple > 0:
-            return False
+        rows = {}
+        for listing in listings:
+            payload = orjson.dumps(listing, option=LISTINGS_JSON_OPTIONS)
+            key = listing.listing_url or f"{listing.name}|{listing.address}"
+            rows[key] = (payload.decode('utf-8'), hashlib.blake2b(payload, digest_size=16).hexdigest())
         
-        # Reason for sale filter (retirement related)
-        retirement_keywords = ['retirement', 'retiring', 'succession', 'aging', 'health']
-        reason_lower = listing.reason_for_sale.lower()
-        if not any(keyword in reason_lower for keyword in retirement_keywords):
-            return False
+        try:
+            known = self._known_hashes(list(rows))
+            changed = [(url, payload, scan_id, scan_id, digest)
+                       for url, (payload, digest) in rows.items() if known.get(url) != digest]
+            unchanged = [(scan_id, url) for url, (_, digest) in rows.items() if known.get(url) == digest]
+            
+            with self._db:
+                self._db.executemany(
+                    "INSERT INTO listings (url, payload, first_seen, last_seen, hash) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(url) DO UPDATE SET payload = excluded.payload, "
+                    "last_seen = excluded.last_seen, hash = excluded.hash",
+                    changed
+                )
+                self._db.executemany("UPDATE listings SET last_seen = ? WHERE url = ?", unchanged)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update listing history: {e}")
+            return None
         
-        return True
+        logger.info(f"Listing history: {len(changed)} new or changed, {len(unchanged)} unchanged")
+        return len(changed)
+    
+    def write_scan_json(self, path: str, scan_id: str, metadata: Dict[str, Any]) -> Optional[int]:
+        """
+        Stream the listings last seen by `scan_id`, cheapest first, into a results file
+        
+        The stored payloads are copied through as-is, followed by `metadata`'s
+        top-level fields. Returns the number of listings written, or None if
+        the file could not be produced.
+        """
+        if self._db is None:
+            return None
+        
+        try:
+            cursor = self._db.execute(
+                "SELECT CAST(payload AS TEXT) FROM listings WHERE last_seen = ? "
+                "ORDER BY json_extract(CAST(payload AS TEXT), '$.price')",
+                (scan_id,)
+            )
+            return _write_listings_json(path, (payload.encode('utf-8') for (payload,) in cursor), metadata)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Failed to write {path} from listing history: {e}")
+            return None
+    
+    def close(self):
+        """Close the database connection"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
 
 class BusinessListingDeduplicator:
     """Deduplicates business listings across platforms"""
@@ -403,6 +1147,7 @@ class BusinessListingDeduplicator:
         """Remove duplicate listings based on name and address similarity"""
         unique_listings = []
         seen_businesses = set()
+        duplicate_count = 0
         
         for listing in listings:
             business_key = self._generate_business_key(listing)
@@ -411,42 +1156,112 @@ class BusinessListingDeduplicator:
                 unique_listings.append(listing)
                 seen_businesses.add(business_key)
             else:
-                logger.info(f"Duplicate found: {listing.name} at {listing.address}")
+                duplicate_count += 1
         
+        if duplicate_count:
+            logger.info(f"Removed {duplicate_count} duplicate listings")
         return unique_listings
     
     def _generate_business_key(self, listing: BusinessListing) -> str:
         """Generate a unique key for business identification"""
-        # Normalize name and address for comparison
-        name_normalized = re.sub(r'[^\w\s]', '', listing.name.lower()).strip()
-        address_normalized = re.sub(r'[^\w\s]', '', listing.address.lower()).strip()
+        # Normalize name and address for comparison in a single pass; the tab
+        # survives the punctuation strip and separates the two again
+        normalized = _NONWORD_RE.sub('', f"{listing.name}\t{listing.address}".lower())
+        name_normalized, _, address_normalized = normalized.partition('\t')
         
-        # Create a composite key
-        return f"{name_normalized}|{address_normalized}"
+        # Create a composite key, interned so repeated keys hash and compare by identity
+        return sys.intern(f"{name_normalized.strip()}|{address_normalized.strip()}")
 
 class BusinessTracker:
     """Main class that orchestrates the business tracking process"""
     
-    def __init__(self):
+    max_scraper_workers = 4
+    
+    def __init__(self, http: Optional[requests.Session] = None, executor: Optional[ThreadPoolExecutor] = None,
+                 proxies: Optional[ProxyRotator] = None, additional_platforms: bool = False):
+        # Every scraper fetches through one keep-alive session (and proxy
+        # rotation, if any), and runs on the caller's thread pool when injected
         self.scrapers = [
-            BizBuySellScraper()
+            BizBuySellScraper(session=http, proxies=proxies)
         ]
+        
+        # The other platforms have no demo-mode guard, so they only run when
+        # asked for; each scrapes a different host, concurrently with the rest
+        if additional_platforms:
+            from additional_scrapers import (BizQuestScraper, BusinessBrokerNetScraper,
+                                             DealStreamScraper, LoopNetScraper)
+            self.scrapers += [
+                scraper_class(session=http, proxies=proxies)
+                for scraper_class in (BizQuestScraper, LoopNetScraper, DealStreamScraper, BusinessBrokerNetScraper)
+            ]
+        self.executor = executor
         self.deduplicator = BusinessListingDeduplicator()
     
-    def run_daily_scan(self) -> Dict[str, Any]:
-        """Run the daily business scan across all platforms"""
+    def run_daily_scan(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """Run the daily business scan across all platforms
+        
+        `force_refresh` re-downloads and re-parses every page instead of
+        reusing listings cached by earlier runs.
+        """
+        logger.info("Starting daily business acquisition scan")
+        page_store.force_refresh = force_refresh
+        
+        # Scrape from all platforms concurrently; each hits a different host.
+        # Selenium fallbacks share the process-wide browser pool, so browsers
+        # start once per run and are shut down when the scrape finishes.
+        results_by_scraper = {}
+        try:
+            with ExitStack() as stack:
+                executor = self.executor
+                if executor is None:
+                    workers = max(1, min(self.max_scraper_workers, len(self.scrapers)))
+                    executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+                futures = {executor.submit(self._run_scraper, scraper): scraper for scraper in self.scrapers}
+                for future in as_completed(futures):
+                    results_by_scraper[futures[future]] = future.result()
+        finally:
+            close_browser_pools()
+        
+        return self._finish_scan(results_by_scraper)
+    
+    async def run_daily_scan_async(self, max_concurrency: int = 10, force_refresh: bool = False) -> Dict[str, Any]:
+        """Run the daily business scan with every platform awaited on one event loop
+        
+        Each scraper runs in a worker thread of the injected executor (or the
+        loop's default one), at most `max_concurrency` at a time, and the scan
+        waits only as long as the slowest platform.
+        """
         logger.info("Starting daily business acquisition scan")
+        page_store.force_refresh = force_refresh
+        
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def scrape(scraper: BusinessScraper) -> List[BusinessListing]:
+            async with semaphore:
+                return await loop.run_in_executor(self.executor, self._run_scraper, scraper)
+        
+        try:
+            gathered = await asyncio.gather(*(scrape(scraper) for scraper in self.scrapers), return_exceptions=True)
+        finally:
+            await asyncio.to_thread(close_browser_pools)
+        
+        results_by_scraper = {}
+        for scraper, platform_listings in zip(self.scrapers, gathered):
+            if isinstance(platform_listings, BaseException):
+                logger.error(f"Error scraping with {scraper.__class__.__name__}: {platform_listings}")
+                platform_listings = []
+            results_by_scraper[scraper] = platform_listings
         
+        return self._finish_scan(results_by_scraper)
+    
+    def _finish_scan(self, results_by_scraper: Dict[BusinessScraper, List[BusinessListing]]) -> Dict[str, Any]:
+        """Deduplicate, sort and save the listings gathered from every scraper"""
         all_listings = []
         
-        # Scrape from all platforms
+        # Combine in scraper order so deduplication keeps the same listing every run
         for scraper in self.scrapers:
-            try:
-                platform_listings = scraper.scrape_listings()
-                all_listings.extend(platform_listings)
-                logger.info(f"Found {len(platform_listings)} listings from {scraper.__class__.__name__}")
-            except Exception as e:
-                logger.error(f"Error scraping with {scraper.__class__.__name__}: {e}")
+            all_listings.extend(results_by_scraper.get(scraper, []))
         
         # Deduplicate across platforms
         unique_listings = self.deduplicator.deduplicate(all_listings)
@@ -455,22 +1270,47 @@ class BusinessTracker:
         # Sort by price (ascending)
         unique_listings.sort(key=lambda x: x.price)
         
-        # Generate results
-        results = {
-            "results": [asdict(listing) for listing in unique_listings],
+        # Generate results; listings stay dataclasses and orjson serializes them
+        now = datetime.now()
+        scan_id = now.isoformat()
+        metadata = {
             "no_matches_reason": "" if unique_listings else "No businesses found matching the specified criteria",
-            "scan_date": datetime.now().isoformat(),
-            "total_listings_found": len(all_listings),
-            "unique_listings": len(unique_listings)
+            "scan_date": scan_id,
+            "total_listings_found": len(all_listings)
         }
         
-        # Save to JSON file
-        output_file = f"business_listings_{datetime.now().strftime('%Y%m%d')}.json"
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        # Only listings that are new or changed since earlier scans are rewritten
+        # in the history, and the JSON file is streamed from this scan's rows
+        output_file = f"business_listings_{now.strftime('%Y%m%d')}.json"
+        written = None
+        history = ListingHistory()
+        try:
+            if history.record(unique_listings, scan_id) is not None:
+                written = history.write_scan_json(output_file, scan_id, metadata)
+        finally:
+            history.close()
+        if written is None:
+            written = _write_listings_json(
+                output_file, (orjson.dumps(listing, option=LISTINGS_JSON_OPTIONS) for listing in unique_listings),
+                metadata
+            )
         
+        results = {"results": unique_listings, **metadata, "unique_listings": written}
+        
+        # Callers read the file back from the path actually written, not a re-derived name
+        results["output_file"] = output_file
         logger.info(f"Results saved to {output_file}")
         return results
+    
+    def _run_scraper(self, scraper: BusinessScraper) -> List[BusinessListing]:
+        """Run a single scraper, logging instead of raising on failure"""
+        try:
+            platform_listings = scraper.scrape_listings()
+            logger.info(f"Found {len(platform_listings)} listings from {scraper.__class__.__name__}")
+            return platform_listings
+        except Exception as e:
+            logger.error(f"Error scraping with {scraper.__class__.__name__}: {e}")
+            return []
 
 if __name__ == "__main__":
     tracker = BusinessTracker()
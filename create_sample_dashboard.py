@@ -4,7 +4,7 @@ Create Sample Dashboard for Testing and Deployment
 This creates a sample HTML dashboard that can be deployed to Vercel
 """
 
-import json
+import orjson
 from datetime import datetime
 from dashboard_generator import DashboardGenerator
 
@@ -103,8 +103,8 @@ def main():
     
     # Save sample JSON
     json_filename = "sample_business_listings.json"
-    with open(json_filename, 'w') as f:
-        json.dump(sample_data, f, indent=2)
+    with open(json_filename, 'wb') as f:
+        f.write(orjson.dumps(sample_data, option=orjson.OPT_INDENT_2))
     
     print(f"✅ Sample data saved to: {json_filename}")
     
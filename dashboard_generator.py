@@ -4,11 +4,54 @@ Business Acquisition Dashboard Generator
 Creates beautiful HTML dashboards from JSON business listing data
 """
 
-import json
+import functools
+import gzip
+import hashlib
 import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, Any, List
-from jinja2 import Template
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+import ijson
+import numpy as np
+import orjson
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, Template, select_autoescape
+from jinja2.filters import do_title
+from markupsafe import Markup, escape
+
+# Listing files above this size are streamed with ijson instead of parsed whole
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+# Listings files are written as plain JSON, or gzipped once they grow large
+LISTINGS_SUFFIXES = (".json.gz", ".json")
+METADATA_FIELDS = frozenset({'no_matches_reason', 'scan_date', 'total_listings_found', 'unique_listings'})
+# Number of template chunks joined per write when streaming the dashboard
+RENDER_BUFFER_SIZE = 64
+GENERATED_TIME_FORMAT = "%B %d, %Y at %I:%M %p"
+
+def _price_stats(prices: np.ndarray) -> Tuple[float, int, float, float]:
+    """Return (total, count, min, max) over the listed (positive) prices"""
+    listed = prices[prices > 0]
+    if not listed.size:
+        return 0.0, 0, 0, 0
+    return float(listed.sum()), int(listed.size), float(listed.min()), float(listed.max())
+
+def _is_listings_file(name: str) -> bool:
+    """Whether a directory entry name is a (possibly gzipped) listings file"""
+    return name.startswith("business_listings_") and name.endswith(LISTINGS_SUFFIXES)
+
+def _open_listings(path: Path):
+    """Open a listings file for binary reading, decompressing .gz files on the fly"""
+    return gzip.open(path, 'rb') if path.suffix == ".gz" else open(path, 'rb')
+
+def _listings_size(path: Path) -> int:
+    """Decoded size of a listings file; gzip records it (mod 4 GiB) in its last four bytes"""
+    if path.suffix != ".gz":
+        return path.stat().st_size
+    with open(path, 'rb') as f:
+        f.seek(-4, os.SEEK_END)
+        return int.from_bytes(f.read(4), 'little')
 
 class DashboardGenerator:
     """Generates HTML dashboards from business listing JSON data"""
@@ -17,69 +60,113 @@ class DashboardGenerator:
         self.template = self._get_html_template()
     
     def generate_dashboard(self, json_file_path: str, output_path: str = None) -> str:
-        """Generate HTML dashboard from JSON data file"""
+        """Generate HTML dashboard from JSON data file
         
-        # Load JSON data
-        with open(json_file_path, 'r') as f:
-            data = json.load(f)
-        
-        # Process data for dashboard
-        processed_data = self._process_data(data)
+        Files larger than STREAM_THRESHOLD_BYTES (uncompressed) are read one
+        listing at a time with ijson instead of being loaded whole. Gzipped
+        .json.gz listings files are decompressed as they are read.
+        """
         
-        # Generate HTML
-        html_content = self.template.render(
-            data=processed_data,
-            generated_time=datetime.now().strftime("%B %d, %Y at %I:%M %p"),
-            total_listings=len(processed_data['results']),
-            scan_date=data.get('scan_date', 'Unknown')
-        )
+        # Load JSON data
+        path = Path(json_file_path)
+        if _listings_size(path) > STREAM_THRESHOLD_BYTES:
+            data = self._read_metadata(path)
+            with _open_listings(path) as f:
+                processed_data = self._process_data(data, ijson.items(f, 'results.item', use_float=True))
+        else:
+            with _open_listings(path) as f:
+                data = orjson.loads(f.read())
+            processed_data = self._process_data(data)
         
         # Save HTML file
         if not output_path:
-            base_name = os.path.splitext(os.path.basename(json_file_path))[0]
+            base_name = path.name.removesuffix(".gz").removesuffix(".json")
             output_path = f"{base_name}_dashboard.html"
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        scan_date = data.get('scan_date', 'Unknown')
+        
+        # Identical inputs render identical HTML, so an up-to-date dashboard is left alone
+        digest = _TEMPLATE_DIGEST.copy()
+        digest.update((scan_date or '').encode('utf-8'))
+        digest.update(orjson.dumps(processed_data))
+        marker = f"<!-- hash: {digest.hexdigest()} -->".encode('ascii')
+        if self._read_hash_marker(output_path) == marker:
+            return output_path
+        
+        # Cards are rendered in plain Python; Jinja only lays out the page around them
+        cards_html = Markup("".join(render_business_card(b) for b in processed_data['results']))
+        
+        # Stream the rendered HTML straight to disk as UTF-8 bytes
+        rendered = self.template.stream(
+            data=processed_data,
+            cards_html=cards_html,
+            css=_MIN_CSS,
+            generated_time=datetime.now().strftime(GENERATED_TIME_FORMAT),
+            total_listings=len(processed_data['results']),
+            scan_date_short=scan_date[:10] if scan_date else 'Unknown Date'
+        )
+        rendered.enable_buffering(RENDER_BUFFER_SIZE)
+        with open(output_path, 'wb') as f:
+            f.write(marker)
+            rendered.dump(f, encoding='utf-8')
         
         return output_path
     
-    def _process_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process raw JSON data for dashboard display"""
-        results = data.get('results', [])
-        
-        # Add summary statistics
-        if results:
-            prices = [r['price'] for r in results if r['price'] > 0]
-            avg_price = sum(prices) / len(prices) if prices else 0
-            min_price = min(prices) if prices else 0
-            max_price = max(prices) if prices else 0
-            
-            # Count by labor intensity
-            labor_counts = {'low': 0, 'medium': 0, 'high': 0}
-            for result in results:
-                labor_intensity = result.get('labor_intensity', 'unknown')
-                if labor_intensity in labor_counts:
-                    labor_counts[labor_intensity] += 1
-            
-            # Count by platform
-            platform_counts = {}
-            for result in results:
-                platform = result.get('platform', 'Unknown')
-                platform_counts[platform] = platform_counts.get(platform, 0) + 1
-        else:
-            avg_price = min_price = max_price = 0
-            labor_counts = {'low': 0, 'medium': 0, 'high': 0}
-            platform_counts = {}
+    def _read_hash_marker(self, output_path: str) -> Optional[bytes]:
+        """Return the input-hash comment at the start of an existing dashboard, if any"""
+        try:
+            with open(output_path, 'rb') as f:
+                head = f.read(64)
+        except OSError:
+            return None
+        end = head.find(b" -->")
+        return head[:end + 4] if head.startswith(b"<!-- hash: ") and end != -1 else None
+    
+    def _read_metadata(self, path: Path) -> Dict[str, Any]:
+        """Read the top-level scan fields of a listings file without building its results"""
+        metadata = {}
+        with _open_listings(path) as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if prefix in METADATA_FIELDS and event in ('string', 'number', 'boolean', 'null'):
+                    metadata[prefix] = value
+        return metadata
+    
+    def _process_data(self, data: Dict[str, Any], results: Optional[Iterable[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Process raw JSON data for dashboard display
+        
+        `results` may be an iterator of listings (e.g. streamed by ijson); it is
+        consumed once, splitting the fields the summary needs into columns.
+        """
+        if results is None:
+            results = data.get('results', [])
+        listings = []
+        price_column = []
+        labor_column = []
+        platform_column = []
+        for result in results:
+            _add_display_fields(result)
+            listings.append(result)
+            price_column.append(result['price'])
+            labor_column.append(result.get('labor_intensity', 'unknown'))
+            platform_column.append(result.get('platform', 'Unknown'))
+        
+        # Add summary statistics, aggregated column-at-a-time
+        price_total, price_count, min_price, max_price = _price_stats(np.array(price_column, dtype=np.float64))
+        avg_price = price_total / price_count if price_count else 0
+        
+        labor_totals = Counter(labor_column)
+        labor_counts = {level: labor_totals[level] for level in ('low', 'medium', 'high')}
+        platform_counts = Counter(platform_column)
         
         return {
-            'results': results,
+            'results': listings,
             'summary': {
                 'avg_price': avg_price,
+                'avg_price_str': f"${avg_price / 1000000:.1f}M",
                 'min_price': min_price,
                 'max_price': max_price,
                 'labor_counts': labor_counts,
-                'platform_counts': platform_counts
+                'platform_counts': dict(platform_counts)
             },
             'no_matches_reason': data.get('no_matches_reason', ''),
             'total_listings_found': data.get('total_listings_found', 0),
@@ -87,15 +174,10 @@ class DashboardGenerator:
         }
     
     def _get_html_template(self) -> Template:
-        """Return the Jinja2 HTML template"""
-        template_str = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Daily Business Acquisition Tracker - {{ scan_date[:10] }}</title>
-    <style>
+        """Return the compiled Jinja2 HTML template, shared by every generator"""
+        return _COMPILED_TEMPLATE
+
+DASHBOARD_CSS = """
         * {
             margin: 0;
             padding: 0;
@@ -394,6 +476,17 @@ class DashboardGenerator:
                 grid-template-columns: 1fr;
             }
         }
+"""
+
+DASHBOARD_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Daily Business Acquisition Tracker - {{ scan_date_short }}</title>
+    <style>
+        {{ css }}
     </style>
 </head>
 <body>
@@ -408,7 +501,7 @@ class DashboardGenerator:
                     <p>Qualifying Businesses</p>
                 </div>
                 <div class="stat-card">
-                    <h3>${{ "%.1f"|format(data.summary.avg_price / 1000000) }}M</h3>
+                    <h3>{{ data.summary.avg_price_str }}</h3>
                     <p>Average Price</p>
                 </div>
                 <div class="stat-card">
@@ -435,93 +528,7 @@ class DashboardGenerator:
             
             {% if data.results %}
                 <div class="business-grid">
-                    {% for business in data.results %}
-                    <div class="business-card {{ business.labor_intensity }}-labor">
-                        <div class="platform-badge">{{ business.platform }}</div>
-                        
-                        <div class="business-name">{{ business.name }}</div>
-                        <div class="business-price">
-                            {% if business.price > 0 %}
-                                ${{ "{:,.0f}".format(business.price) }}
-                            {% else %}
-                                Price on Request
-                            {% endif %}
-                        </div>
-                        
-                        <div class="business-tags">
-                            <span class="tag labor-{{ business.labor_intensity }}">
-                                {{ business.labor_intensity }} labor
-                            </span>
-                            <span class="tag ai-risk">
-                                {% if "low" in business.ai_disruptability.lower() %}
-                                    Low AI Risk
-                                {% elif "high" in business.ai_disruptability.lower() %}
-                                    High AI Risk
-                                {% else %}
-                                    Medium AI Risk
-                                {% endif %}
-                            </span>
-                        </div>
-                        
-                        <div class="business-details">
-                            <div class="detail-item">
-                                <div class="detail-label">Location</div>
-                                <div class="detail-value">{{ business.address }}</div>
-                            </div>
-                            
-                            <div class="detail-item">
-                                <div class="detail-label">Distance</div>
-                                <div class="detail-value">
-                                    {% if business.distance_miles %}
-                                        {{ business.distance_miles }} miles
-                                    {% else %}
-                                        Calculating...
-                                    {% endif %}
-                                </div>
-                            </div>
-                            
-                            <div class="detail-item">
-                                <div class="detail-label">Visit Frequency</div>
-                                <div class="detail-value">{{ business.visit_frequency|title }}</div>
-                            </div>
-                            
-                            <div class="detail-item">
-                                <div class="detail-label">Sale Reason</div>
-                                <div class="detail-value">{{ business.reason_for_sale|title }}</div>
-                            </div>
-                            
-                            {% if business.earnings_multiple > 0 %}
-                            <div class="detail-item">
-                                <div class="detail-label">Earnings Multiple</div>
-                                <div class="detail-value">{{ business.earnings_multiple }}x</div>
-                            </div>
-                            {% endif %}
-                            
-                            {% if business.ownership_structure != "unknown" %}
-                            <div class="detail-item">
-                                <div class="detail-label">Ownership</div>
-                                <div class="detail-value">{{ business.ownership_structure }}</div>
-                            </div>
-                            {% endif %}
-                        </div>
-                        
-                        {% if business.ai_disruptability %}
-                        <div class="ai-assessment">
-                            <strong>AI Assessment:</strong> {{ business.ai_disruptability }}
-                        </div>
-                        {% endif %}
-                        
-                        {% if business.partial_match_explanation %}
-                        <div class="ai-assessment" style="border-left-color: #f39c12;">
-                            <strong>Note:</strong> {{ business.partial_match_explanation }}
-                        </div>
-                        {% endif %}
-                        
-                        <a href="{{ business.listing_url }}" target="_blank" class="business-link">
-                            View Full Listing →
-                        </a>
-                    </div>
-                    {% endfor %}
+                    {{ cards_html }}
                 </div>
             {% else %}
                 <div class="no-results">
@@ -535,26 +542,216 @@ class DashboardGenerator:
         </div>
         
         <div class="footer">
-            <p>Dashboard generated on {{ generated_time }} | Data from {{ scan_date[:10] if scan_date else 'Unknown Date' }}</p>
+            <p>Dashboard generated on {{ generated_time }} | Data from {{ scan_date_short }}</p>
             <p>Tracking {{ data.summary.platform_counts|length }} platforms for business opportunities</p>
         </div>
     </div>
 </body>
 </html>
-        """
-        return Template(template_str)
+"""
+
+def _add_display_fields(business: Dict[str, Any]):
+    """
+    Precompute the HTML-ready strings shown on a business card
+    
+    Listing text is escaped here exactly once and stored as Markup under a
+    `*_html` key; strings built only from trusted values are wrapped in Markup
+    directly, so nothing is escaped again at render time.
+    """
+    price = business.get('price', 0)
+    business['price_str'] = Markup(f"${price:,.0f}" if price > 0 else "Price on Request")
+    
+    ai_disruptability = business.get('ai_disruptability') or ''
+    ai_lower = ai_disruptability.lower()
+    if "low" in ai_lower:
+        business['ai_risk_label'] = Markup("Low AI Risk")
+    elif "high" in ai_lower:
+        business['ai_risk_label'] = Markup("High AI Risk")
+    else:
+        business['ai_risk_label'] = Markup("Medium AI Risk")
+    
+    labor_html = escape(business.get('labor_intensity', ''))
+    distance = business.get('distance_miles')
+    business['labor_intensity_html'] = labor_html
+    business['card_class'] = labor_html + Markup("-labor")
+    business['distance_str'] = escape(distance) + Markup(" miles") if distance else Markup("Calculating...")
+    business['visit_frequency_title'] = escape(do_title(business.get('visit_frequency', '')))
+    business['reason_for_sale_title'] = escape(do_title(business.get('reason_for_sale', '')))
+    
+    business['name_html'] = escape(business.get('name', ''))
+    business['address_html'] = escape(business.get('address', ''))
+    business['platform_html'] = escape(business.get('platform', ''))
+    business['listing_url_html'] = escape(business.get('listing_url', ''))
+    business['ai_disruptability_html'] = escape(ai_disruptability)
+    business['ownership_structure_html'] = escape(business.get('ownership_structure', ''))
+    business['partial_match_explanation_html'] = escape(business.get('partial_match_explanation') or '')
+    
+    variant = 0
+    if business.get('earnings_multiple', 0) > 0:
+        variant |= CARD_EARNINGS
+    if business.get('ownership_structure') != "unknown":
+        variant |= CARD_OWNERSHIP
+    if ai_disruptability:
+        variant |= CARD_AI_NOTE
+    if business['partial_match_explanation_html']:
+        variant |= CARD_PARTIAL_NOTE
+    business['card_variant'] = variant
+
+# Business card markup, split at its optional sections. Each combination of
+# sections is joined into one format string the first time it is needed.
+_CARD_HEAD = """
+<div class="business-card {card_class}">
+    <div class="platform-badge">{platform_html}</div>
+    
+    <div class="business-name">{name_html}</div>
+    <div class="business-price">{price_str}</div>
+    
+    <div class="business-tags">
+        <span class="tag labor-{labor_intensity_html}">{labor_intensity_html} labor</span>
+        <span class="tag ai-risk">{ai_risk_label}</span>
+    </div>
+    
+    <div class="business-details">
+        <div class="detail-item">
+            <div class="detail-label">Location</div>
+            <div class="detail-value">{address_html}</div>
+        </div>
+        
+        <div class="detail-item">
+            <div class="detail-label">Distance</div>
+            <div class="detail-value">{distance_str}</div>
+        </div>
+        
+        <div class="detail-item">
+            <div class="detail-label">Visit Frequency</div>
+            <div class="detail-value">{visit_frequency_title}</div>
+        </div>
+        
+        <div class="detail-item">
+            <div class="detail-label">Sale Reason</div>
+            <div class="detail-value">{reason_for_sale_title}</div>
+        </div>"""
+_CARD_EARNINGS = """
+        <div class="detail-item">
+            <div class="detail-label">Earnings Multiple</div>
+            <div class="detail-value">{earnings_multiple}x</div>
+        </div>"""
+_CARD_OWNERSHIP = """
+        <div class="detail-item">
+            <div class="detail-label">Ownership</div>
+            <div class="detail-value">{ownership_structure_html}</div>
+        </div>"""
+_CARD_DETAILS_END = """
+    </div>"""
+_CARD_AI_NOTE = """
+    <div class="ai-assessment">
+        <strong>AI Assessment:</strong> {ai_disruptability_html}
+    </div>"""
+_CARD_PARTIAL_NOTE = """
+    <div class="ai-assessment" style="border-left-color: #f39c12;">
+        <strong>Note:</strong> {partial_match_explanation_html}
+    </div>"""
+_CARD_TAIL = """
+    
+    <a href="{listing_url_html}" target="_blank" class="business-link">
+        View Full Listing →
+    </a>
+</div>
+"""
+
+# Bits of a listing's `card_variant`, one per optional card section
+CARD_EARNINGS = 1
+CARD_OWNERSHIP = 2
+CARD_AI_NOTE = 4
+CARD_PARTIAL_NOTE = 8
+
+@functools.lru_cache(maxsize=None)
+def _card_format(variant: int) -> str:
+    """Build the card format string containing only the sections in `variant`"""
+    parts = [_CARD_HEAD]
+    if variant & CARD_EARNINGS:
+        parts.append(_CARD_EARNINGS)
+    if variant & CARD_OWNERSHIP:
+        parts.append(_CARD_OWNERSHIP)
+    parts.append(_CARD_DETAILS_END)
+    if variant & CARD_AI_NOTE:
+        parts.append(_CARD_AI_NOTE)
+    if variant & CARD_PARTIAL_NOTE:
+        parts.append(_CARD_PARTIAL_NOTE)
+    parts.append(_CARD_TAIL)
+    return "".join(parts)
+
+def render_business_card(business: Dict[str, Any]) -> Markup:
+    """
+    Render one business card as HTML
+    
+    The card is rendered for every listing, so it is filled in with one
+    `format_map` call on the specialized format string for the listing's
+    `card_variant` instead of driving Jinja's template machinery per card.
+    Every value comes from the escaped fields set by `_add_display_fields`
+    in `_process_data`.
+    """
+    if 'price_str' not in business:
+        _add_display_fields(business)
+    return Markup(_card_format(business['card_variant']).format_map(business))
+
+# Compiled template code is cached on disk, keyed by the source checksum, so a
+# fresh process loads it instead of lexing, parsing and compiling again
+JINJA_CACHE_DIR = os.path.expanduser("~/.cache/buyingbusiness/jinja")
+
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Disk bytecode cache for the template, or None if the directory can't be created"""
+    try:
+        os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+        return FileSystemBytecodeCache(directory=JINJA_CACHE_DIR)
+    except OSError:
+        return None
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet"""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    return _CSS_PUNCTUATION_RE.sub(r"\1", css).strip()
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCTUATION_RE = re.compile(r"\s*([{}:;,>])\s*")
+# The stylesheet is identical in every dashboard, so it is minified once per process
+_MIN_CSS = Markup(_minify_css(DASHBOARD_CSS))
+
+# Seeds every dashboard's input hash, so template or stylesheet edits force a re-render
+_TEMPLATE_DIGEST = hashlib.blake2b(digest_size=16)
+for _source in (DASHBOARD_TEMPLATE, DASHBOARD_CSS, _CARD_HEAD, _CARD_EARNINGS, _CARD_OWNERSHIP,
+                _CARD_DETAILS_END, _CARD_AI_NOTE, _CARD_PARTIAL_NOTE, _CARD_TAIL):
+    _TEMPLATE_DIGEST.update(_source.encode('utf-8'))
+
+# Compiled once at import so constructing a generator never recompiles it
+_ENVIRONMENT = Environment(
+    loader=DictLoader({"dashboard.html": DASHBOARD_TEMPLATE}),
+    bytecode_cache=_bytecode_cache(),
+    autoescape=select_autoescape(["html"]),
+    trim_blocks=True,
+    lstrip_blocks=True
+)
+_COMPILED_TEMPLATE = _ENVIRONMENT.get_template("dashboard.html")
 
 def generate_latest_dashboard():
     """Generate dashboard from the most recent JSON file"""
-    import glob
+    # Find the most recent JSON file in one directory scan
+    latest_file = None
+    latest_ctime = 0.0
+    with os.scandir(".") as entries:
+        for entry in entries:
+            name = entry.name
+            if _is_listings_file(name) and entry.is_file():
+                ctime = entry.stat().st_ctime
+                if latest_file is None or ctime > latest_ctime:
+                    latest_file, latest_ctime = name, ctime
     
-    # Find the most recent JSON file
-    json_files = glob.glob("business_listings_*.json")
-    if not json_files:
+    if latest_file is None:
         print("No business listing JSON files found.")
         return
     
-    latest_file = max(json_files, key=os.path.getctime)
     print(f"Generating dashboard from: {latest_file}")
     
     generator = DashboardGenerator()
@@ -563,5 +760,35 @@ def generate_latest_dashboard():
     print(f"Dashboard generated: {output_file}")
     return output_file
 
+def _generate_dashboard_file(json_file_path: str) -> str:
+    """Process-pool worker: render one listings file with this process's compiled template"""
+    return DashboardGenerator().generate_dashboard(json_file_path)
+
+def generate_all_dashboards(max_workers: Optional[int] = None) -> List[str]:
+    """Generate a dashboard for every listings JSON file, one file per worker process"""
+    with os.scandir(".") as entries:
+        json_files = sorted(
+            entry.name for entry in entries
+            if _is_listings_file(entry.name) and entry.is_file()
+        )
+    
+    if not json_files:
+        print("No business listing JSON files found.")
+        return []
+    
+    output_files = []
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {executor.submit(_generate_dashboard_file, path): path for path in json_files}
+        for future in as_completed(futures):
+            try:
+                output_file = future.result()
+            except Exception as e:
+                print(f"Failed to generate dashboard from {futures[future]}: {e}")
+                continue
+            print(f"Dashboard generated: {output_file}")
+            output_files.append(output_file)
+    
+    return sorted(output_files)
+
 if __name__ == "__main__":
     generate_latest_dashboard()
@@ -6,14 +6,53 @@ A truthful implementation that acknowledges limitations and provides real soluti
 
 import json
 import logging
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import requests
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True, frozen=True)
+class ApiOption:
+    """One way of acquiring listing data"""
+    name: str
+    available: bool
+    description: str
+    url: str = ""
+    requires_key: bool = False
+    cost: str = ""
+    legal_considerations: str = ""
+    risk: str = ""
+
+_API_OPTIONS: Tuple[ApiOption, ...] = (
+    ApiOption(
+        name="zyla_api",
+        available=True,
+        description="Third-party BizBuySell API via Zyla API Hub",
+        url="https://zylalabs.com/api-marketplace/real%2Bestate%2B%26%2Bhousing/bizbuysell%2Blistings%2Bdata%2Bapi/8592",
+        requires_key=True,
+        cost="Paid service - pricing varies"
+    ),
+    ApiOption(
+        name="apify_scraper",
+        available=True,
+        description="Apify's BizBuySell scraper service",
+        url="https://apify.com/acquistion-automation/bizbuysell-scraper",
+        requires_key=True,
+        cost="Paid service based on usage"
+    ),
+    ApiOption(
+        name="direct_scraping",
+        available=True,
+        description="Custom scraping (must respect ToS)",
+        legal_considerations="Must review each site's Terms of Service",
+        risk="Sites may block or change structure"
+    )
+)
+
 class RealisticBusinessTracker:
     """
     A realistic business tracker that:
@@ -24,28 +63,7 @@ class RealisticBusinessTracker:
     """
     
     def __init__(self):
-        self.api_options = {
-            "zyla_api": {
-                "available": True,
-                "description": "Third-party BizBuySell API via Zyla API Hub",
-                "url": "https://zylalabs.com/api-marketplace/real%2Bestate%2B%26%2Bhousing/bizbuysell%2Blistings%2Bdata%2Bapi/8592",
-                "requires_key": True,
-                "cost": "Paid service - pricing varies"
-            },
-            "apify_scraper": {
-                "available": True,
-                "description": "Apify's BizBuySell scraper service",
-                "url": "https://apify.com/acquistion-automation/bizbuysell-scraper",
-                "requires_key": True,
-                "cost": "Paid service based on usage"
-            },
-            "direct_scraping": {
-                "available": True,
-                "description": "Custom scraping (must respect ToS)",
-                "legal_considerations": "Must review each site's Terms of Service",
-                "risk": "Sites may block or change structure"
-            }
-        }
+        self.api_options = _API_OPTIONS
     
     def get_api_recommendations(self) -> Dict[str, Any]:
         """
@@ -95,6 +113,58 @@ class RealisticBusinessTracker:
             "next_steps": "Choose API provider and implement data acquisition"
         }
 
+# Shared, read-only answers returned by LegitimateDataSources
+_BIZBUYSELL_OPTIONS = {
+    "official_api": "None publicly available",
+    "third_party_apis": [
+        {
+            "provider": "Zyla API Hub",
+            "url": "https://zylalabs.com/api-marketplace/real%2Bestate%2B%26%2Bhousing/bizbuysell%2Blistings%2Bdata%2Bapi/8592",
+            "status": "Available",
+            "authentication": "API Key required",
+            "rate_limits": "Varies by plan"
+        }
+    ],
+    "scraping_services": [
+        {
+            "provider": "Apify",
+            "url": "https://apify.com/acquistion-automation/bizbuysell-scraper",
+            "status": "Available",
+            "pricing": "Pay per use",
+            "features": ["Deduplication", "Scheduling", "Multiple formats"]
+        }
+    ],
+    "terms_of_service": "https://www.bizbuysell.com/terms-of-use",
+    "robots_txt": "https://www.bizbuysell.com/robots.txt"
+}
+
+_OTHER_PLATFORMS = {
+    "bizquest": {
+        "official_api": "None publicly available",
+        "url": "https://www.bizquest.com",
+        "scraping_difficulty": "Medium",
+        "terms_url": "https://www.bizquest.com/terms"
+    },
+    "loopnet": {
+        "official_api": "Limited commercial API",
+        "url": "https://www.loopnet.com",
+        "scraping_difficulty": "High (anti-bot measures)",
+        "terms_url": "https://www.loopnet.com/terms-of-use/"
+    },
+    "dealstream": {
+        "official_api": "None publicly available",
+        "url": "https://www.dealstream.com",
+        "scraping_difficulty": "Medium",
+        "terms_url": "https://www.dealstream.com/terms"
+    },
+    "businessbroker_net": {
+        "official_api": "None publicly available",
+        "url": "https://www.businessbroker.net",
+        "scraping_difficulty": "Low-Medium",
+        "terms_url": "https://www.businessbroker.net/terms"
+    }
+}
+
 class LegitimateDataSources:
     """
     Information about legitimate data sources and their requirements
@@ -102,58 +172,13 @@ class LegitimateDataSources:
     
     @staticmethod
     def get_bizbuysell_options():
-        return {
-            "official_api": "None publicly available",
-            "third_party_apis": [
-                {
-                    "provider": "Zyla API Hub",
-                    "url": "https://zylalabs.com/api-marketplace/real%2Bestate%2B%26%2Bhousing/bizbuysell%2Blistings%2Bdata%2Bapi/8592",
-                    "status": "Available",
-                    "authentication": "API Key required",
-                    "rate_limits": "Varies by plan"
-                }
-            ],
-            "scraping_services": [
-                {
-                    "provider": "Apify",
-                    "url": "https://apify.com/acquistion-automation/bizbuysell-scraper",
-                    "status": "Available",
-                    "pricing": "Pay per use",
-                    "features": ["Deduplication", "Scheduling", "Multiple formats"]
-                }
-            ],
-            "terms_of_service": "https://www.bizbuysell.com/terms-of-use",
-            "robots_txt": "https://www.bizbuysell.com/robots.txt"
-        }
+        """Return the shared BizBuySell options; callers must not mutate it"""
+        return _BIZBUYSELL_OPTIONS
     
     @staticmethod
     def get_other_platforms():
-        return {
-            "bizquest": {
-                "official_api": "None publicly available",
-                "url": "https://www.bizquest.com",
-                "scraping_difficulty": "Medium",
-                "terms_url": "https://www.bizquest.com/terms"
-            },
-            "loopnet": {
-                "official_api": "Limited commercial API",
-                "url": "https://www.loopnet.com",
-                "scraping_difficulty": "High (anti-bot measures)",
-                "terms_url": "https://www.loopnet.com/terms-of-use/"
-            },
-            "dealstream": {
-                "official_api": "None publicly available",
-                "url": "https://www.dealstream.com",
-                "scraping_difficulty": "Medium",
-                "terms_url": "https://www.dealstream.com/terms"
-            },
-            "businessbroker_net": {
-                "official_api": "None publicly available",
-                "url": "https://www.businessbroker.net",
-                "scraping_difficulty": "Low-Medium",
-                "terms_url": "https://www.businessbroker.net/terms"
-            }
-        }
+        """Return the shared platform table; callers must not mutate it"""
+        return _OTHER_PLATFORMS
 
 def main():
     """
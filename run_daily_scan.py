@@ -2,92 +2,182 @@
 """
 Daily Business Acquisition Scanner
 Automated script that runs the daily business scan and generates the dashboard
+
+The tracker writes business_listings_YYYYMMDD.json with orjson
+(business_scraper.LISTINGS_JSON_OPTIONS) and the dashboard generator reads
+that same file back with orjson, or streams it with ijson when it is large.
 """
 
+import asyncio
+import gzip
 import os
+import shutil
 import sys
 import logging
-import webbrowser
-from datetime import datetime
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
+from typing import Iterator, Optional
 
 # Add current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from business_scraper import BusinessTracker
-from dashboard_generator import DashboardGenerator
+# Platform scrapes are I/O-bound; past about ten threads the overhead dominates
+SCRAPER_THREADS = 10
+# Scan log, and how many gzipped daily backups of it are kept
+LOG_FILE = "daily_scan.log"
+LOG_BACKUP_DAYS = 30
+# business_scraper configures this file only when it is imported before any
+# logging is set up, which the scan's lazy imports never do
+SCRAPER_LOG_FILE = "business_scraper.log"
+
+def _gzip_rotator(source: str, dest: str):
+    """Compress a rolled-over log file into its backup name"""
+    with open(source, 'rb') as sf, gzip.open(dest, 'wb') as df:
+        shutil.copyfileobj(sf, df)
+    os.remove(source)
 
-def setup_logging():
-    """Setup logging for the daily scan"""
-    log_file = f"daily_scan_{datetime.now().strftime('%Y%m%d')}.log"
+@contextmanager
+def setup_logging() -> Iterator[logging.Logger]:
+    """
+    Setup logging for the daily scan
+    
+    Records are handed to a queue and written by a background listener thread
+    to the rotating log file, business_scraper.log (scraper records only) and
+    the console, unless the caller already logs there, so the scan never waits
+    on disk. The listener is flushed and stopped when the block exits.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    
+    # One log file, rolled over at midnight into a gzipped daily backup
+    file_handler = TimedRotatingFileHandler(LOG_FILE, when='midnight', backupCount=LOG_BACKUP_DAYS)
+    file_handler.namer = lambda name: name + ".gz"
+    file_handler.rotator = _gzip_rotator
+    
+    # The scraper's own records also keep going to its log file
+    scraper_handler = logging.FileHandler(SCRAPER_LOG_FILE)
+    scraper_handler.addFilter(logging.Filter("business_scraper"))
     
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
-    return logging.getLogger(__name__)
+    root = logging.getLogger()
+    handlers = [file_handler, scraper_handler]
+    if not root.handlers:
+        handlers.append(logging.StreamHandler())
+        root.setLevel(logging.INFO)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root.addHandler(queue_handler)
+    listener.start()
+    try:
+        yield logging.getLogger(__name__)
+    finally:
+        root.removeHandler(queue_handler)
+        listener.stop()
+        for handler in handlers:
+            handler.close()
 
-def run_daily_scan():
+def run_daily_scan(force_refresh: bool = False, open_browser: Optional[bool] = None,
+                   all_platforms: bool = False):
     """Run the complete daily business acquisition scan"""
-    logger = setup_logging()
-    logger.info("=" * 60)
-    logger.info("STARTING DAILY BUSINESS ACQUISITION SCAN")
-    logger.info("=" * 60)
+    return asyncio.run(run_daily_scan_async(force_refresh=force_refresh, open_browser=open_browser,
+                                            all_platforms=all_platforms))
+
+async def run_daily_scan_async(force_refresh: bool = False, open_browser: Optional[bool] = None,
+                               all_platforms: bool = False):
+    """
+    Run the complete daily business acquisition scan on an event loop
     
-    try:
-        # Initialize tracker
-        tracker = BusinessTracker()
-        
-        # Run the scan
-        logger.info("Scanning business listings across platforms...")
-        results = tracker.run_daily_scan()
-        
-        # Get the JSON file path
-        json_file = f"business_listings_{datetime.now().strftime('%Y%m%d')}.json"
-        
-        # Generate dashboard
-        logger.info("Generating HTML dashboard...")
-        generator = DashboardGenerator()
-        dashboard_file = generator.generate_dashboard(json_file)
-        
-        # Convert to absolute path for opening in browser
-        dashboard_path = Path(dashboard_file).absolute()
-        
-        # Log results summary
+    The dashboard is opened in a browser when `open_browser` is set; by default
+    only when running in a terminal with a display, never from the scheduler.
+    `all_platforms` also scrapes BizQuest, LoopNet, DealStream and
+    BusinessBroker.net alongside BizBuySell.
+    """
+    with setup_logging() as logger:
         logger.info("=" * 60)
-        logger.info("SCAN COMPLETE - SUMMARY")
+        logger.info("STARTING DAILY BUSINESS ACQUISITION SCAN")
         logger.info("=" * 60)
-        logger.info(f"Total listings found: {results.get('total_listings_found', 0)}")
-        logger.info(f"Unique qualifying businesses: {results.get('unique_listings', 0)}")
-        logger.info(f"JSON results saved to: {json_file}")
-        logger.info(f"HTML dashboard saved to: {dashboard_file}")
-        
-        if results.get('results'):
-            logger.info("\nTop 3 opportunities by price:")
-            for i, business in enumerate(results['results'][:3], 1):
-                price_str = f"${business['price']:,}" if business['price'] > 0 else "Price on request"
-                logger.info(f"  {i}. {business['name']} - {price_str}")
         
-        # Try to open dashboard in browser
         try:
-            webbrowser.open(f"file://{dashboard_path}")
-            logger.info(f"\nDashboard opened in browser: {dashboard_path}")
-        except Exception as e:
-            logger.warning(f"Could not open browser automatically: {e}")
-            logger.info(f"Please manually open: {dashboard_path}")
-        
-        logger.info("=" * 60)
-        return True
+            # The scraping and rendering stacks are imported per scan, so a scheduler
+            # idling between runs does not keep them resident
+            from business_scraper import BusinessScraper, BusinessTracker, ProxyRotator
+            from dashboard_generator import DashboardGenerator
+            
+            # Initialize tracker with one pooled keep-alive session and one thread
+            # pool shared by every platform scraper
+            http = BusinessScraper.get_session()
+            
+            # Optional proxy rotation, configured as PROXY_URLS=http://p1:8080,http://p2:8080
+            proxies = ProxyRotator.from_env()
+            if proxies is not None:
+                logger.info("Rotating requests across %d proxies", len(proxies.proxy_urls))
+            
+            with ThreadPoolExecutor(max_workers=SCRAPER_THREADS) as executor:
+                tracker = BusinessTracker(http=http, executor=executor, proxies=proxies,
+                                          additional_platforms=all_platforms)
+                
+                # Run the scan
+                logger.info("Scanning business listings across platforms...")
+                results = await tracker.run_daily_scan_async(force_refresh=force_refresh)
+            
+            # The JSON file the tracker actually wrote
+            json_file = results['output_file']
+            
+            # Generate dashboard
+            dashboard_file = f"{Path(json_file).stem}_dashboard.html"
+            logger.info("Generating HTML dashboard...")
+            generator = DashboardGenerator()
+            dashboard_file = generator.generate_dashboard(json_file, dashboard_file)
+            
+            # Resolve once for the log lines and the browser's file:// URL
+            resolved = Path(dashboard_file).resolve()
+            dashboard_path = os.fspath(resolved)
+            
+            # Log results summary
+            logger.info("=" * 60)
+            logger.info("SCAN COMPLETE - SUMMARY")
+            logger.info("=" * 60)
+            logger.info("Total listings found: %s", results.get('total_listings_found', 0))
+            logger.info("Unique qualifying businesses: %s", results.get('unique_listings', 0))
+            logger.info("JSON results saved to: %s", json_file)
+            logger.info("HTML dashboard saved to: %s", dashboard_file)
+            
+            # The prices are formatted only when the summary will actually be logged
+            if results.get('results') and logger.isEnabledFor(logging.INFO):
+                logger.info("\nTop 3 opportunities by price:")
+                for i, business in enumerate(results['results'][:3], 1):
+                    price_str = f"${business.price:,}" if business.price > 0 else "Price on request"
+                    logger.info("  %d. %s - %s", i, business.name, price_str)
+            
+            # Try to open dashboard in browser, only when someone is there to see it
+            if open_browser is None:
+                open_browser = sys.stdout.isatty() and (sys.platform in ("darwin", "win32") or bool(os.environ.get('DISPLAY')))
+            if open_browser:
+                try:
+                    import webbrowser
+                    webbrowser.open(resolved.as_uri())
+                    logger.info("\nDashboard opened in browser: %s", dashboard_path)
+                except Exception as e:
+                    logger.warning("Could not open browser automatically: %s", e)
+                    logger.info("Please manually open: %s", dashboard_path)
+            else:
+                logger.info("Open the dashboard at: %s", dashboard_path)
+            
+            logger.info("=" * 60)
+            return True
         
-    except Exception as e:
-        logger.error(f"Error during daily scan: {e}")
-        logger.error("Check the log file for detailed error information")
-        return False
+        except Exception as e:
+            logger.error("Error during daily scan: %s", e)
+            logger.error("Check the log file for detailed error information")
+            return False
 
 if __name__ == "__main__":
-    success = run_daily_scan()
+    args = sys.argv[1:]
+    success = run_daily_scan(force_refresh="--force-refresh" in args, open_browser=True if "--open" in args else None,
+                             all_platforms="--all-platforms" in args)
     sys.exit(0 if success else 1)
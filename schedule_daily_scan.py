@@ -4,12 +4,14 @@ Scheduler for Daily Business Acquisition Scans
 Sets up automated daily execution of the business scanning process
 """
 
+import os
 import schedule
 import time
-import subprocess
 import logging
-import os
 from datetime import datetime
+from pathlib import Path
+
+from run_daily_scan import run_daily_scan
 
 # Setup logging
 logging.basicConfig(
@@ -27,30 +29,20 @@ def run_scan_job():
     logger.info("Starting scheduled business acquisition scan...")
     
     try:
-        # Get the directory where this script is located
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        scan_script = os.path.join(script_dir, 'run_daily_scan.py')
-        
-        # Run the daily scan script
-        result = subprocess.run(
-            ['python3', scan_script],
-            capture_output=True,
-            text=True,
-            cwd=script_dir
-        )
-        
-        if result.returncode == 0:
+        if run_daily_scan(open_browser=False):
             logger.info("Daily scan completed successfully!")
-            logger.info(f"Output: {result.stdout}")
         else:
-            logger.error(f"Daily scan failed with return code {result.returncode}")
-            logger.error(f"Error: {result.stderr}")
+            logger.error("Daily scan failed; see the daily scan log for details")
             
     except Exception as e:
         logger.error(f"Error running scheduled scan: {e}")
 
 def main():
     """Main scheduler function"""
+    # Launched from cron, launchd or another directory, the scan's caches, JSON
+    # and dashboards still belong next to the scripts
+    os.chdir(Path(__file__).resolve().parent)
+    
     logger.info("Business Acquisition Scanner Scheduler Started")
     logger.info("Scheduled to run daily at 9:00 AM")
     
@@ -61,10 +53,14 @@ def main():
     logger.info("Running initial scan...")
     run_scan_job()
     
-    # Keep the scheduler running
+    # Keep the scheduler running, sleeping straight through to the next job
     while True:
+        idle_seconds = schedule.idle_seconds()
+        if idle_seconds is None:
+            break
+        if idle_seconds > 0:
+            time.sleep(idle_seconds)
         schedule.run_pending()
-        time.sleep(60)  # Check every minute
 
 if __name__ == "__main__":
     try: